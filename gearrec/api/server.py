@@ -532,7 +532,8 @@ async def sweep(inputs: AircraftInputs):
     """
     try:
         generator = GearGenerator(inputs)
-        result = generator.run_sweep()
+        # Serial sweep: request handlers never start worker processes
+        result = generator.run_sweep(max_workers=1)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -11,6 +11,7 @@ Usage:
 
 import argparse
 import json
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -270,8 +271,7 @@ def cmd_recommend(args: argparse.Namespace) -> int:
         
         # Print summary to stderr
         print(f"\nSummary: Generated {len(result.concepts)} concepts", file=sys.stderr)
-        passing = len([c for c in result.concepts if c.all_checks_passed])
-        print(f"  Passing all checks: {passing}", file=sys.stderr)
+        print(f"  Passing all checks: {len(result.passing_concepts)}", file=sys.stderr)
         print(f"  Best score: {result.best_concept.score:.2f}", file=sys.stderr)
         
         if result.warnings:
@@ -432,4 +432,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for the sweep process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     sys.exit(cli())
@@ -0,0 +1,75 @@
+"""
+Plain-float numeric kernels for the candidate generator hot paths.
+
+These compose the gearrec.physics functions into the tuples the generator
+consumes once per sweep point, so the equations live only in the physics
+package. The check margins (tip_back_margin, nose_over_margin,
+ground_clearance_margin) are used straight from gearrec.physics.geometry.
+
+This is for CONCEPTUAL SIZING ONLY - not for certification.
+"""
+
+from gearrec.physics.energy import (
+    calculate_required_shock_force,
+    calculate_touchdown_energy,
+)
+from gearrec.physics.loads import (
+    calculate_main_load_per_wheel,
+    calculate_static_load_split_taildragger,
+    calculate_static_load_split_tricycle,
+)
+
+
+def evaluate_load_case(
+    weight_N: float,
+    landing_mass_kg: float,
+    sink_rate_mps: float,
+    x_cg: float,
+    x_main: float,
+    x_nose_or_tail: float,
+    is_tricycle: bool,
+    wheels_per_main_leg: int,
+    stroke_m: float,
+    efficiency: float = 0.80,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    Evaluate static load split, touchdown energy and shock force for one load case.
+    
+    Combines calculate_touchdown_energy, calculate_static_load_split_*,
+    calculate_main_load_per_wheel (two main legs) and
+    calculate_required_shock_force.
+    
+    Args:
+        weight_N: Aircraft weight in Newtons
+        landing_mass_kg: Aircraft mass at landing
+        sink_rate_mps: Vertical touchdown velocity in m/s
+        x_cg: CG position from datum (m)
+        x_main: Main gear contact point from datum (m)
+        x_nose_or_tail: Nose (tricycle) or tail (taildragger) contact point (m)
+        is_tricycle: True for tricycle, False for taildragger
+        wheels_per_main_leg: Number of wheels per main gear leg
+        stroke_m: Shock absorber stroke in meters
+        efficiency: Shock absorber efficiency
+        
+    Returns:
+        Tuple of (landing_energy_J, nose_or_tail_load_N, main_load_total_N,
+        main_load_per_wheel_N, required_avg_force_N, nose_fraction)
+        
+    Raises:
+        ValueError: If the gear layout or stroke/efficiency is invalid
+    """
+    energy = calculate_touchdown_energy(landing_mass_kg, sink_rate_mps)
+    
+    if is_tricycle:
+        split = calculate_static_load_split_tricycle(weight_N, x_cg, x_main, x_nose_or_tail)
+    else:
+        split = calculate_static_load_split_taildragger(weight_N, x_cg, x_main, x_nose_or_tail)
+    r_main = split.main_load_total_N
+    
+    main_per_wheel = calculate_main_load_per_wheel(r_main, wheels_per_main_leg)
+    force = calculate_required_shock_force(energy, stroke_m, efficiency)
+    
+    return (
+        energy, split.nose_or_tail_load_N, r_main,
+        main_per_wheel, force, split.nose_fraction,
+    )
@@ -5,7 +5,12 @@ Creates and evaluates multiple gear configurations based on aircraft inputs.
 This is for CONCEPTUAL SIZING ONLY - not for certification.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product, repeat
+from operator import attrgetter, countOf
 from typing import Iterator
 
 from gearrec.models.inputs import AircraftInputs, RunwayType
@@ -25,10 +30,12 @@ from gearrec.models.outputs import (
     SweepPoint,
     ConceptSweepResult,
     SweepResult,
+    CheckFlags,
+    ALL_CHECKS_PASSED_MASK,
+    failed_check_names,
 )
 from gearrec.physics import (
     calculate_touchdown_energy,
-    calculate_required_shock_force,
     calculate_track_range,
     calculate_wheelbase_range,
     calculate_strut_length_range,
@@ -37,24 +44,40 @@ from gearrec.physics import (
     kg_to_N,
 )
 from gearrec.physics.loads import (
-    calculate_static_load_split_tricycle,
-    calculate_static_load_split_taildragger,
     calculate_dynamic_load_factor,
     calculate_tire_load_requirements,
     estimate_gear_positions_tricycle,
     estimate_gear_positions_taildragger,
-    calculate_main_load_per_wheel,
 )
 from gearrec.physics.geometry import (
     check_ground_clearance,
     check_lateral_rollover,
+    ground_clearance_margin,
+    nose_over_margin,
+    tip_back_margin,
+    SafetyCheckResult,
 )
 from gearrec.physics.energy import recommend_stroke_range_for_aircraft
-from gearrec.physics.tire_catalog import find_matching_tires, estimate_tire_dimensions
+from gearrec.physics.tire_catalog import (
+    find_matching_tires,
+    estimate_tire_dimensions,
+    tire_size_band,
+    tire_size_factors,
+)
 from gearrec.scoring.scorer import GearScorer
+from gearrec.generator._kernels import evaluate_load_case
+
+
+# C-level sort/max keys (avoid a Python lambda call per comparison)
+_score_key = attrgetter("score")
+_pass_rate_key = attrgetter("pass_rate")
+_passed_key = attrgetter("all_checks_passed")
+
+# failed_checks of a sweep point whose configuration could not be built
+_BUILD_FAILED = ("build_failed",)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CandidateConfig:
     """Configuration for a candidate gear concept."""
     config: GearConfig
@@ -66,6 +89,16 @@ class CandidateConfig:
     wheelbase_m: float
 
 
+@dataclass(frozen=True, slots=True)
+class EvaluatedConcept:
+    """Physics and check results for a candidate configuration, prior to scoring."""
+    config: CandidateConfig
+    geometry: Geometry
+    loads: Loads
+    tire_suggestion: TireSuggestion
+    checks: Checks
+
+
 class GearGenerator:
     """
     Generator for landing gear concept candidates.
@@ -100,6 +133,14 @@ class GearGenerator:
             self.mlw_kg, inputs.sink_rate_mps
         )
         
+        # Memoized _evaluate_concept results, keyed by (config, cg, sink)
+        self._evaluation_cache: dict[
+            tuple[CandidateConfig, float, float], EvaluatedConcept | None
+        ] = {}
+        
+        # Memoized _gear_contact_positions results, keyed by layout
+        self._gear_positions_cache: dict[GearConfig, tuple[float, float]] = {}
+        
         # Get recommended stroke range
         self.stroke_range = recommend_stroke_range_for_aircraft(
             inputs.mtow_kg,
@@ -161,19 +202,27 @@ class GearGenerator:
             List of GearConcept objects, sorted by score (best first).
             Guarantees at least one tricycle candidate in results.
         """
-        candidates = []
-        tricycle_candidates = []
-        
-        # Generate all configuration combinations
-        for config in self._get_valid_configs():
-            concept = self._build_concept(config)
-            if concept is not None:
-                candidates.append(concept)
-                if concept.config == GearConfig.TRICYCLE:
-                    tricycle_candidates.append(concept)
-        
+        # Evaluate all configuration combinations, then score them in one batch
+        evaluated = [
+            e for e in map(self._evaluate_concept, self._get_valid_configs())
+            if e is not None
+        ]
+        scored = self.scorer.score_batch(
+            [
+                (e.config.config, e.config.gear_type, e.checks, e.loads, e.geometry)
+                for e in evaluated
+            ],
+            self.inputs.runway,
+        )
+        candidates = [
+            concept
+            for concept in map(self._assemble_concept, evaluated, scored)
+            if concept is not None
+        ]
+        tricycle_candidates = [c for c in candidates if c.config == GearConfig.TRICYCLE]
+
         # Sort by score (descending)
-        candidates.sort(key=lambda c: c.score, reverse=True)
+        candidates.sort(key=_score_key, reverse=True)
         
         # Select top candidates, ensuring at least one tricycle
         result = []
@@ -189,7 +238,7 @@ class GearGenerator:
         # Guarantee at least one tricycle if we have any
         if not tricycle_included and tricycle_candidates:
             # Find best tricycle and add it
-            best_tricycle = max(tricycle_candidates, key=lambda c: c.score)
+            best_tricycle = max(tricycle_candidates, key=_score_key)
             if len(result) >= 6:
                 # Replace lowest-scoring non-tricycle
                 for i in range(len(result) - 1, -1, -1):
@@ -204,7 +253,7 @@ class GearGenerator:
             result = candidates[:max(3, len(candidates))]
         
         # Re-sort
-        result.sort(key=lambda c: c.score, reverse=True)
+        result.sort(key=_score_key, reverse=True)
         
         return result[:6]
     
@@ -301,10 +350,62 @@ class GearGenerator:
         Returns:
             GearConcept if valid, None if fails hard constraints
         """
+        evaluated = self._evaluate_concept(config, cg_position, sink_rate)
+        if evaluated is None:
+            return None
+        
+        scored = self.scorer.score_concept(
+            config=config.config,
+            gear_type=config.gear_type,
+            checks=evaluated.checks,
+            loads=evaluated.loads,
+            geometry=evaluated.geometry,
+            runway_type=self.inputs.runway,
+        )
+        return self._assemble_concept(evaluated, scored)
+    
+    def _evaluate_concept(
+        self, 
+        config: CandidateConfig,
+        cg_position: float | None = None,
+        sink_rate: float | None = None,
+    ) -> EvaluatedConcept | None:
+        """
+        Run the physics and safety checks for a configuration (no scoring).
+        
+        Results are memoized per generator, so repeated entry points (e.g.
+        generate_result followed by run_sweep) evaluate each configuration
+        once.
+        
+        Args:
+            config: Candidate configuration to evaluate
+            cg_position: Optional specific CG position (for sweep), otherwise uses mid CG
+            sink_rate: Optional specific sink rate (for sweep), otherwise uses input
+            
+        Returns:
+            EvaluatedConcept if valid, None if fails hard constraints
+        """
         # Use provided values or defaults
         cg_pos = cg_position if cg_position is not None else self.inputs.cg_mid_m
         sink = sink_rate if sink_rate is not None else self.inputs.sink_rate_mps
         
+        key = (config, cg_pos, sink)
+        if key in self._evaluation_cache:
+            return self._evaluation_cache[key]
+        evaluated = self._evaluation_cache[key] = self._run_evaluation(config, cg_pos, sink)
+        return evaluated
+    
+    def _run_evaluation(
+        self,
+        config: CandidateConfig,
+        cg_pos: float,
+        sink: float,
+    ) -> EvaluatedConcept | None:
+        """Uncached body of _evaluate_concept."""
+        # Hard constraints that depend on the configuration alone
+        if not self._passes_config_constraints(config):
+            return None
+        
         try:
             # Calculate geometry
             geometry = self._calculate_geometry(config)
@@ -312,45 +413,72 @@ class GearGenerator:
             # Calculate loads
             loads = self._calculate_loads(config, cg_pos, sink)
             
-            # Calculate tire suggestions
-            tire_suggestion = self._calculate_tire_suggestion(config, loads)
-            
-            # Run safety checks
-            checks = self._run_checks(config, geometry, loads, tire_suggestion, cg_pos)
+            # Tire envelope and ground clearance (prop clearance hard constraint)
+            diam_range, width_range = estimate_tire_dimensions(
+                loads.static_main_load_per_wheel_N,
+                self.inputs.runway.value,
+                self.inputs.tire_pressure_limit_kpa,
+            )
+            clearance_check = self._check_ground_clearance(geometry, diam_range)
             
-            # Check hard constraints
-            if not self._passes_hard_constraints(config, checks):
+            # Reject before tire matching, CG sensitivity and scoring
+            if not self._passes_clearance_constraints(clearance_check):
                 return None
             
-            # Generate explanation
-            explanation = self._generate_explanation(config, geometry, loads, checks)
+            # Calculate tire suggestions
+            tire_suggestion = self._calculate_tire_suggestion(
+                config, loads, diam_range, width_range,
+            )
             
-            # Calculate score
-            score, breakdown = self.scorer.score_concept(
-                config=config.config,
-                gear_type=config.gear_type,
-                checks=checks,
-                loads=loads,
-                geometry=geometry,
-                runway_type=self.inputs.runway,
+            # Run safety checks
+            checks = self._run_checks(
+                config, geometry, loads, tire_suggestion, cg_pos, clearance_check,
+            )
+        except Exception:
+            # Skip invalid candidates
+            return None
+        
+        return EvaluatedConcept(
+            config=config,
+            geometry=geometry,
+            loads=loads,
+            tire_suggestion=tire_suggestion,
+            checks=checks,
+        )
+    
+    def _assemble_concept(
+        self,
+        evaluated: EvaluatedConcept,
+        scored: tuple[float, ScoreBreakdown],
+    ) -> GearConcept | None:
+        """Combine an evaluated configuration and its score into a GearConcept."""
+        config = evaluated.config
+        score, breakdown = scored
+        
+        try:
+            # Generate explanation
+            explanation = self._generate_explanation(
+                config, evaluated.geometry, evaluated.loads, evaluated.checks,
             )
             
+            # The evaluation is memoized and shared between calls, so each
+            # concept gets its own copies of the models callers may modify
             return GearConcept(
                 config=config.config,
                 gear_type=config.gear_type,
                 wheel_count_main=config.wheels_per_main_leg,
                 wheel_count_nose_or_tail=config.wheels_nose_or_tail,
-                geometry=geometry,
-                tire_suggestion=tire_suggestion,
-                loads=loads,
-                checks=checks,
+                geometry=evaluated.geometry.model_copy(deep=True),
+                tire_suggestion=evaluated.tire_suggestion.model_copy(deep=True),
+                loads=evaluated.loads.model_copy(deep=True),
+                checks=evaluated.checks.model_copy(deep=True),
                 explanation=explanation,
                 assumptions=self.assumptions.copy(),
                 input_summary=self._build_input_summary(),
                 score=score,
                 score_breakdown=breakdown,
             )
-        except Exception as e:
+        except Exception:
             # Skip invalid candidates
             return None
     
@@ -396,12 +524,61 @@ class GearGenerator:
         config: CandidateConfig, 
         cg_position: float,
         sink_rate: float,
+        gear_positions: tuple[float, float] | None = None,
     ) -> Loads:
-        """Calculate load distribution for the configuration."""
-        # Recalculate energy for this sink rate
-        touchdown_energy = calculate_touchdown_energy(self.mlw_kg, sink_rate)
+        """
+        Calculate load distribution for the configuration.
+        
+        gear_positions, if given, is the (x_main, x_nose_or_tail) pair from
+        _gear_contact_positions; sweeps pass it in so it is computed once per
+        configuration rather than once per point.
+        """
+        if gear_positions is None:
+            gear_positions = self._gear_contact_positions(config)
+        x_main, x_other = gear_positions
+        
+        # Energy, static split, per-wheel load and shock force in one float kernel
+        (
+            touchdown_energy,
+            nose_or_tail_load,
+            main_load_total,
+            main_load_per_wheel,
+            required_force,
+            nose_fraction,
+        ) = evaluate_load_case(
+            self.weight_N,
+            self.mlw_kg,
+            sink_rate,
+            cg_position,
+            x_main,
+            x_other,
+            config.config == GearConfig.TRICYCLE,
+            config.wheels_per_main_leg,
+            config.stroke_m,
+        )
+        
+        return Loads(
+            weight_N=self.weight_N,
+            static_nose_or_tail_load_N=nose_or_tail_load,
+            static_main_load_total_N=main_load_total,
+            static_main_load_per_wheel_N=main_load_per_wheel,
+            landing_energy_J=touchdown_energy,
+            required_avg_force_N=required_force,
+            nose_load_fraction=nose_fraction,
+        )
+    
+    def _gear_contact_positions(self, config: CandidateConfig) -> tuple[float, float]:
+        """
+        Mid-range (x_main, x_nose_or_tail) contact positions for the configuration.
+        
+        The positions depend on the gear layout and the aircraft inputs only,
+        so they are computed once per layout and shared by the load, stability
+        and CG sensitivity calculations.
+        """
+        cached = self._gear_positions_cache.get(config.config)
+        if cached is not None:
+            return cached
         
-        # Get gear positions
         if config.config == GearConfig.TRICYCLE:
             x_nose_min, x_nose_max, x_main_min, x_main_max = estimate_gear_positions_tricycle(
                 self.inputs.cg_fwd_m,
@@ -410,12 +587,8 @@ class GearGenerator:
                 self.inputs.main_gear_attach_guess_m,
                 self.inputs.nose_gear_attach_guess_m,
             )
-            x_nose = (x_nose_min + x_nose_max) / 2
+            x_other = (x_nose_min + x_nose_max) / 2
             x_main = (x_main_min + x_main_max) / 2
-            
-            load_split = calculate_static_load_split_tricycle(
-                self.weight_N, cg_position, x_main, x_nose,
-            )
         else:
             x_main_min, x_main_max, x_tail_min, x_tail_max = estimate_gear_positions_taildragger(
                 self.inputs.cg_fwd_m,
@@ -424,40 +597,18 @@ class GearGenerator:
                 self.inputs.main_gear_attach_guess_m,
             )
             x_main = (x_main_min + x_main_max) / 2
-            x_tail = (x_tail_min + x_tail_max) / 2
-            
-            load_split = calculate_static_load_split_taildragger(
-                self.weight_N, cg_position, x_main, x_tail,
-            )
-        
-        # Calculate per-wheel load
-        main_load_per_wheel = calculate_main_load_per_wheel(
-            load_split.main_load_total_N,
-            config.wheels_per_main_leg,
-        )
-        
-        # Calculate required shock force
-        required_force = calculate_required_shock_force(
-            touchdown_energy,
-            config.stroke_m,
-        )
-        
-        return Loads(
-            weight_N=self.weight_N,
-            static_nose_or_tail_load_N=load_split.nose_or_tail_load_N,
-            static_main_load_total_N=load_split.main_load_total_N,
-            static_main_load_per_wheel_N=main_load_per_wheel,
-            landing_energy_J=touchdown_energy,
-            required_avg_force_N=required_force,
-            nose_load_fraction=load_split.nose_fraction,
-        )
+            x_other = (x_tail_min + x_tail_max) / 2
+        positions = self._gear_positions_cache[config.config] = (x_main, x_other)
+        return positions
     
     def _calculate_tire_suggestion(
         self, 
         config: CandidateConfig, 
-        loads: Loads
+        loads: Loads,
+        diam_range: GeometryRange,
+        width_range: GeometryRange,
     ) -> TireSuggestion:
-        """Calculate tire sizing suggestions."""
+        """Calculate tire sizing suggestions for precomputed tire dimension ranges."""
         dynamic_factor = calculate_dynamic_load_factor(
             self.inputs.sink_rate_mps,
             config.stroke_m,
@@ -468,13 +619,7 @@ class GearGenerator:
             dynamic_factor,
         )
         
-        # Get diameter and width ranges
         prefer_soft = self.inputs.runway in [RunwayType.GRASS, RunwayType.GRAVEL]
-        diam_range, width_range = estimate_tire_dimensions(
-            loads.static_main_load_per_wheel_N,
-            self.inputs.runway.value,
-            self.inputs.tire_pressure_limit_kpa,
-        )
         
         # Find matching catalog tires
         matched_tires = find_matching_tires(
@@ -499,20 +644,28 @@ class GearGenerator:
         loads: Loads,
         tire: TireSuggestion,
         cg_position: float,
+        clearance_check: SafetyCheckResult,
     ) -> Checks:
-        """Run all safety and stability checks."""
+        """Run all safety and stability checks (ground clearance is precomputed)."""
+        return self._apply_clearance_check(
+            self._run_stability_checks(config, geometry),
+            clearance_check.passed,
+            clearance_check.margin_value,
+        )
+    
+    def _run_stability_checks(self, config: CandidateConfig, geometry: Geometry) -> Checks:
+        """
+        Run the checks that do not depend on the evaluated load case.
+        
+        Tip-back/nose-over use the CG limits, rollover uses the track and
+        CG height, so the result is shared by every (sink rate, CG) point of
+        a configuration. Clearance fields are filled in by _apply_clearance_check.
+        """
         wheelbase = config.wheelbase_m
+        x_main, x_other = self._gear_contact_positions(config)
         
         if config.config == GearConfig.TRICYCLE:
-            x_nose_min, x_nose_max, x_main_min, x_main_max = estimate_gear_positions_tricycle(
-                self.inputs.cg_fwd_m,
-                self.inputs.cg_aft_m,
-                self.fuselage_length,
-                self.inputs.main_gear_attach_guess_m,
-                self.inputs.nose_gear_attach_guess_m,
-            )
-            x_nose = (x_nose_min + x_nose_max) / 2
-            x_main = (x_main_min + x_main_max) / 2
+            x_nose = x_other
             
             # Tip-back check (use aft CG - worst case)
             tip_back = check_tip_back_margin(
@@ -525,20 +678,12 @@ class GearGenerator:
                 braking_decel_g=self.inputs.brake_decel_g,
             )
         else:
-            x_main_min, x_main_max, x_tail_min, x_tail_max = estimate_gear_positions_taildragger(
-                self.inputs.cg_fwd_m,
-                self.inputs.cg_aft_m,
-                self.fuselage_length,
-                self.inputs.main_gear_attach_guess_m,
-            )
-            x_main = (x_main_min + x_main_max) / 2
-            
-            tip_back_margin = (self.inputs.cg_fwd_m - x_main) / wheelbase
+            tip_back_ratio = (self.inputs.cg_fwd_m - x_main) / wheelbase
             tip_back = CheckResult(
-                passed=tip_back_margin > 0.05,
-                value=tip_back_margin,
+                passed=tip_back_ratio > 0.05,
+                value=tip_back_ratio,
                 limit=0.05,
-                description=f"CG forward of main gear by {tip_back_margin*100:.1f}% of wheelbase",
+                description=f"CG forward of main gear by {tip_back_ratio*100:.1f}% of wheelbase",
             )
             
             nose_over = CheckResult(
@@ -546,23 +691,11 @@ class GearGenerator:
                 description="Nose-over check not applicable for taildragger",
             )
         
-        # Ground clearance check
-        tire_radius = tire.recommended_tire_diameter_range_m.mid / 2
-        clearance_check = check_ground_clearance(
-            geometry.main_strut_length_m.mid,
-            geometry.stroke_m.mid,
-            tire_radius,
-            self.inputs.prop_clearance_m,
-        )
-        
         # Lateral rollover check
         rollover_check = check_lateral_rollover(config.track_m, self.cg_height)
         
-        prop_ok = clearance_check.passed if self.inputs.prop_clearance_m > 0 else True
-        prop_margin = clearance_check.margin_value if self.inputs.prop_clearance_m > 0 else None
-        
         # CG sensitivity analysis
-        cg_sensitivity = self._analyze_cg_sensitivity(config, geometry, loads, tire)
+        cg_sensitivity = self._analyze_cg_sensitivity(config, geometry)
         
         return Checks(
             tip_back_margin=CheckResult(
@@ -577,20 +710,33 @@ class GearGenerator:
                 limit=nose_over.required_margin,
                 description=nose_over.description,
             ),
-            ground_clearance_ok=clearance_check.passed,
+            ground_clearance_ok=True,
             lateral_stability_ok=rollover_check.passed,
-            prop_clearance_ok=prop_ok,
             rollover_angle_deg=rollover_check.margin_value,
-            prop_clearance_margin_m=prop_margin,
             cg_range_sensitivity=cg_sensitivity,
         )
     
+    def _apply_clearance_check(
+        self,
+        checks: Checks,
+        clearance_passed: bool,
+        clearance_margin: float,
+    ) -> Checks:
+        """Return a copy of the stability checks with ground/prop clearance results."""
+        prop_clearance = self.inputs.prop_clearance_m
+        prop_ok = clearance_passed if prop_clearance > 0 else True
+        prop_margin = clearance_margin if prop_clearance > 0 else None
+        
+        return checks.model_copy(update={
+            "ground_clearance_ok": clearance_passed,
+            "prop_clearance_ok": prop_ok,
+            "prop_clearance_margin_m": prop_margin,
+        })
+    
     def _analyze_cg_sensitivity(
         self,
         config: CandidateConfig,
         geometry: Geometry,
-        loads: Loads,
-        tire: TireSuggestion,
     ) -> CGSensitivity:
         """Analyze how checks vary across CG range."""
         cg_positions = [
@@ -604,35 +750,33 @@ class GearGenerator:
         worst_pos = "mid"
         critical_check = None
         
-        for cg, label in cg_positions:
-            # Simplified check at each CG
-            if config.config == GearConfig.TRICYCLE:
-                x_nose_min, x_nose_max, x_main_min, x_main_max = estimate_gear_positions_tricycle(
-                    self.inputs.cg_fwd_m, self.inputs.cg_aft_m, self.fuselage_length,
-                    self.inputs.main_gear_attach_guess_m, self.inputs.nose_gear_attach_guess_m,
-                )
-                x_main = (x_main_min + x_main_max) / 2
-                x_nose = (x_nose_min + x_nose_max) / 2
-                
-                tip_back = check_tip_back_margin(cg, x_main, config.wheelbase_m, self.cg_height)
-                nose_over = check_nose_over_margin(
-                    cg, x_main, x_nose, self.cg_height, self.inputs.brake_decel_g
+        if config.config == GearConfig.TRICYCLE:
+            # Gear positions do not depend on the CG being checked
+            x_main, x_nose = self._gear_contact_positions(config)
+            wheelbase = config.wheelbase_m
+            cg_height = self.cg_height
+            brake_decel_g = self.inputs.brake_decel_g
+            
+            # Simplified check at each CG (margins only, no descriptions)
+            for cg, label in cg_positions:
+                tip_back_passed, tip_back = tip_back_margin(cg, x_main, wheelbase)
+                nose_over_passed, nose_over = nose_over_margin(
+                    cg, x_nose, cg_height, brake_decel_g
                 )
                 
-                all_pass = tip_back.passed and nose_over.passed
-                if all_pass:
+                if tip_back_passed and nose_over_passed:
                     pass_count += 1
                 
-                score = min(tip_back.margin_value, nose_over.margin_value)
+                score = min(tip_back, nose_over)
                 if score < worst_score:
                     worst_score = score
                     worst_pos = label
-                    if not tip_back.passed:
+                    if not tip_back_passed:
                         critical_check = "tip_back"
-                    elif not nose_over.passed:
+                    elif not nose_over_passed:
                         critical_check = "nose_over"
-            else:
-                pass_count += 1  # Taildragger less sensitive
+        else:
+            pass_count = len(cg_positions)  # Taildragger less sensitive
         
         return CGSensitivity(
             pass_rate=pass_count / len(cg_positions),
@@ -640,11 +784,32 @@ class GearGenerator:
             critical_check=critical_check,
         )
     
-    def _passes_hard_constraints(self, config: CandidateConfig, checks: Checks) -> bool:
-        """Check if configuration passes hard constraints."""
+    def _check_ground_clearance(
+        self,
+        geometry: Geometry,
+        diam_range: GeometryRange,
+    ) -> SafetyCheckResult:
+        """Run the ground/prop clearance check for the main gear geometry."""
+        # Bind range midpoints once
+        tire_radius = diam_range.mid * 0.5
+        strut_mid = geometry.main_strut_length_m.mid
+        stroke_mid = geometry.stroke_m.mid
+        return check_ground_clearance(
+            strut_mid,
+            stroke_mid,
+            tire_radius,
+            self.inputs.prop_clearance_m,
+        )
+    
+    def _passes_config_constraints(self, config: CandidateConfig) -> bool:
+        """Check hard constraints that need no physics (gear type vs. inputs)."""
         if self.inputs.retractable and config.gear_type == GearType.FIXED:
             return False
-        if not checks.prop_clearance_ok:
+        return True
+    
+    def _passes_clearance_constraints(self, clearance_check: SafetyCheckResult) -> bool:
+        """Check the prop clearance hard constraint (only when clearance is required)."""
+        if self.inputs.prop_clearance_m > 0 and not clearance_check.passed:
             return False
         return True
     
@@ -719,10 +884,170 @@ class GearGenerator:
             warnings=warnings,
         )
     
+    def _evaluate_sweep_grid(
+        self,
+        config: CandidateConfig,
+        grid: list[tuple[float, float, str]],
+    ) -> list[SweepPoint]:
+        """
+        Evaluate one configuration across a grid of sweep points.
+        
+        Everything that does not depend on the sweep point (geometry, gear
+        contact positions, the stability checks and the runway/tire pressure
+        inputs) is computed once for the whole grid, and loads, the tire
+        envelope, ground clearance and the score once per CG position.
+        Full GearConcept outputs (catalog tire matching, explanation text)
+        are never built for sweep points, and points rejected by the prop
+        clearance hard constraint exit before scoring. Scoring reads a
+        CheckFlags tuple rather than a Checks model copy.
+        
+        SweepPoint is a plain slotted dataclass, so building one per grid
+        point costs no validation.
+        
+        Args:
+            config: Candidate configuration to sweep
+            grid: List of (sink_rate, cg_position, cg_label) points
+            
+        Returns:
+            One SweepPoint per grid point, in grid order
+        """
+        if not self._passes_config_constraints(config):
+            return [_failed_sweep_point(sink, cg, label) for sink, cg, label in grid]
+        
+        try:
+            geometry = self._calculate_geometry(config)
+            gear_positions = self._gear_contact_positions(config)
+            stability_checks = self._run_stability_checks(config, geometry)
+        except Exception:
+            return [_failed_sweep_point(sink, cg, label) for sink, cg, label in grid]
+        
+        diam_factor, _ = tire_size_factors(
+            self.inputs.runway.value, self.inputs.tire_pressure_limit_kpa,
+        )
+        
+        # A point's outcome depends on its CG position only: sink rate enters
+        # through touchdown energy and shock force, which no check or score
+        # term reads. Each CG position is evaluated once, as (score, mask) or
+        # None if rejected, and reused for every sink rate in the grid.
+        outcomes: dict[float, tuple[float, int] | None] = {}
+        points = []
+        for sink, cg, cg_label in grid:
+            if cg in outcomes:
+                outcome = outcomes[cg]
+            else:
+                outcome = outcomes[cg] = self._evaluate_sweep_cg(
+                    config, geometry, gear_positions, stability_checks,
+                    diam_factor, cg, sink,
+                )
+            
+            if outcome is None:
+                points.append(_failed_sweep_point(sink, cg, cg_label))
+                continue
+            
+            score, mask = outcome
+            points.append(SweepPoint(
+                sink,
+                cg,
+                cg_label,
+                mask == ALL_CHECKS_PASSED_MASK,
+                score,
+                list(failed_check_names(mask)),
+            ))
+        
+        return points
+    
+    def _evaluate_sweep_cg(
+        self,
+        config: CandidateConfig,
+        geometry: Geometry,
+        gear_positions: tuple[float, float],
+        stability_checks: Checks,
+        diam_factor: float,
+        cg: float,
+        sink: float,
+    ) -> tuple[float, int] | None:
+        """
+        Evaluate one CG position of a sweep grid.
+        
+        Returns:
+            (score, passed_mask), or None if the point fails a hard constraint
+        """
+        prop_clearance = self.inputs.prop_clearance_m
+        try:
+            loads = self._calculate_loads(config, cg, sink, gear_positions)
+            # Same rejection as TireSuggestion validation (loads must be >= 0)
+            if loads.static_main_load_per_wheel_N < 0:
+                raise ValueError("Negative main wheel load")
+            # Main tire radius from the estimate_tire_dimensions diameter
+            # midpoint, on floats (no GeometryRange per point)
+            diam_min, diam_max, _, _ = tire_size_band(
+                loads.static_main_load_per_wheel_N
+            )
+            tire_radius = (diam_min * diam_factor + diam_max * diam_factor) * 0.5 * 0.5
+            # Flag and margin only; the check description is never shown
+            clearance_passed, _ = ground_clearance_margin(
+                geometry.main_strut_length_m.mid,
+                geometry.stroke_m.mid,
+                tire_radius,
+                prop_clearance,
+            )
+        except Exception:
+            return None
+        
+        # Prop clearance hard constraint (see _passes_clearance_constraints)
+        if prop_clearance > 0 and not clearance_passed:
+            return None
+        
+        # Slim check mirror instead of a Checks copy per point
+        checks = CheckFlags(
+            stability_checks.tip_back_margin,
+            stability_checks.nose_over_margin,
+            clearance_passed,
+            stability_checks.lateral_stability_ok,
+            clearance_passed if prop_clearance > 0 else True,
+        )
+        score, _ = self.scorer.score_concept(
+            config=config.config,
+            gear_type=config.gear_type,
+            checks=checks,
+            loads=loads,
+            geometry=geometry,
+            runway_type=self.inputs.runway,
+        )
+        return score, checks.passed_mask
+    
+    def _sweep_concept(
+        self,
+        config: CandidateConfig,
+        grid: list[tuple[float, float, str]],
+    ) -> ConceptSweepResult:
+        """Sweep one configuration across the grid and summarize the statistics."""
+        sweep_points = self._evaluate_sweep_grid(config, grid)
+        
+        # Calculate statistics over a column of scores so the reductions run
+        # in C rather than as a Python loop over the points
+        pass_count = countOf(map(_passed_key, sweep_points), True)
+        scores = list(map(_score_key, sweep_points))
+        
+        n_points = len(sweep_points)
+        # Validated construction on purpose: pydantic-core builds these flat
+        # models faster through __init__ than through model_construct, and
+        # SweepPoint dataclass instances are accepted without revalidation
+        return ConceptSweepResult(
+            config=config.config,
+            gear_type=config.gear_type,
+            pass_rate=pass_count / n_points if n_points else 0,
+            avg_score=sum(scores) / n_points if n_points else 0,
+            worst_case_score=min(scores) if n_points else 0,
+            best_case_score=max(scores) if n_points else 0,
+            sweep_points=sweep_points,
+        )
+    
     def run_sweep(
         self,
         sink_rates: list[float] | None = None,
         cg_positions: list[float] | None = None,
+        max_workers: int | None = 1,
     ) -> SweepResult:
         """
         Run sensitivity sweep across sink rates and CG positions.
@@ -730,6 +1055,9 @@ class GearGenerator:
         Args:
             sink_rates: List of sink rates to evaluate. If None, uses default range.
             cg_positions: List of CG positions. If None, uses fwd/mid/aft.
+            max_workers: Worker processes for the sweep. Defaults to 1, which
+                         sweeps all concepts serially in-process; None uses
+                         the CPU count.
             
         Returns:
             SweepResult with pass rates and scores for each concept.
@@ -760,11 +1088,8 @@ class GearGenerator:
         # Get unique configurations to sweep
         base_candidates = self.generate_candidates()
         
-        concept_results = []
-        
-        for concept in base_candidates:
-            # Find matching config
-            config = CandidateConfig(
+        configs = [
+            CandidateConfig(
                 config=concept.config,
                 gear_type=concept.gear_type,
                 wheels_per_main_leg=concept.wheel_count_main,
@@ -773,61 +1098,34 @@ class GearGenerator:
                 track_m=concept.geometry.track_m.mid,
                 wheelbase_m=concept.geometry.wheelbase_m.mid,
             )
-            
-            sweep_points = []
-            
-            for sink in sink_rates:
-                for cg in cg_positions:
-                    # Rebuild concept at this point
-                    test_concept = self._build_concept(config, cg_position=cg, sink_rate=sink)
-                    
-                    if test_concept is None:
-                        sweep_points.append(SweepPoint(
-                            sink_rate_mps=sink,
-                            cg_position_m=cg,
-                            cg_label=cg_labels.get(cg, f"{cg:.2f}m"),
-                            all_checks_passed=False,
-                            score=0.0,
-                            failed_checks=["build_failed"],
-                        ))
-                    else:
-                        failed = []
-                        if not test_concept.checks.tip_back_margin.passed:
-                            failed.append("tip_back")
-                        if not test_concept.checks.nose_over_margin.passed:
-                            failed.append("nose_over")
-                        if not test_concept.checks.ground_clearance_ok:
-                            failed.append("ground_clearance")
-                        if not test_concept.checks.lateral_stability_ok:
-                            failed.append("lateral_stability")
-                        if not test_concept.checks.prop_clearance_ok:
-                            failed.append("prop_clearance")
-                        
-                        sweep_points.append(SweepPoint(
-                            sink_rate_mps=sink,
-                            cg_position_m=cg,
-                            cg_label=cg_labels.get(cg, f"{cg:.2f}m"),
-                            all_checks_passed=test_concept.all_checks_passed,
-                            score=test_concept.score,
-                            failed_checks=failed,
-                        ))
-            
-            # Calculate statistics
-            scores = [p.score for p in sweep_points]
-            pass_count = sum(1 for p in sweep_points if p.all_checks_passed)
-            
-            concept_results.append(ConceptSweepResult(
-                config=concept.config,
-                gear_type=concept.gear_type,
-                pass_rate=pass_count / len(sweep_points) if sweep_points else 0,
-                avg_score=sum(scores) / len(scores) if scores else 0,
-                worst_case_score=min(scores) if scores else 0,
-                best_case_score=max(scores) if scores else 0,
-                sweep_points=sweep_points,
-            ))
+            for concept in base_candidates
+        ]
+        
+        # Label each CG position once, then build the (sink, cg) grid shared
+        # by all concepts. Values are coerced to float here because SweepPoint
+        # stores them as given.
+        labeled_cgs = [
+            (float(cg), cg_labels.get(cg, f"{cg:.2f}m")) for cg in cg_positions
+        ]
+        grid = [
+            (sink, cg, cg_label)
+            for sink, (cg, cg_label) in product(map(float, sink_rates), labeled_cgs)
+        ]
+        
+        # Each concept's sweep is independent, so concepts can be dispatched
+        # to a process pool (one task per concept) when workers are requested.
+        if max_workers == 1 or len(configs) <= 1:
+            concept_results = [self._sweep_concept(config, grid) for config in configs]
+        else:
+            inputs_json = self.inputs.model_dump_json()
+            workers = min(len(configs), max_workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                concept_results = list(executor.map(
+                    _sweep_one_concept, repeat(inputs_json), configs, repeat(grid),
+                ))
         
         # Find most robust
-        most_robust = max(concept_results, key=lambda r: r.pass_rate)
+        most_robust = max(concept_results, key=_pass_rate_key)
         most_robust_name = f"{most_robust.config.value}_{most_robust.gear_type.value}"
         
         return SweepResult(
@@ -838,3 +1136,33 @@ class GearGenerator:
             most_robust_concept=most_robust_name,
             warnings=[],
         )
+
+
+@lru_cache(maxsize=1)
+def _get_worker_generator(inputs_json: str) -> GearGenerator:
+    """Build (once per worker process) the generator for a serialized input set."""
+    return GearGenerator(AircraftInputs.model_validate_json(inputs_json))
+
+
+def _sweep_one_concept(
+    inputs_json: str,
+    config: CandidateConfig,
+    grid: list[tuple[float, float, str]],
+) -> ConceptSweepResult:
+    """
+    Sweep one concept in a worker process.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        inputs_json: Serialized AircraftInputs
+        config: Candidate configuration to sweep
+        grid: List of (sink_rate, cg_position, cg_label) points
+    """
+    generator = _get_worker_generator(inputs_json)
+    return generator._sweep_concept(config, grid)
+
+
+def _failed_sweep_point(sink: float, cg: float, cg_label: str) -> SweepPoint:
+    """Sweep point for a configuration that could not be built at that point."""
+    return SweepPoint(sink, cg, cg_label, False, 0.0, list(_BUILD_FAILED))
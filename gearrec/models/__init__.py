@@ -15,6 +15,7 @@ from gearrec.models.outputs import (
     CheckResult,
     CGSensitivity,
     Checks,
+    CheckFlags,
     ScoreBreakdown,
     RecommendationResult,
     SweepPoint,
@@ -37,6 +38,7 @@ __all__ = [
     "CheckResult",
     "CGSensitivity",
     "Checks",
+    "CheckFlags",
     "ScoreBreakdown",
     "RecommendationResult",
     "SweepPoint",
@@ -6,9 +6,10 @@ conceptual sizing. This is for CONCEPTUAL SIZING ONLY - not certification.
 """
 
 from enum import Enum
+from math import sqrt
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class RunwayType(str, Enum):
@@ -30,17 +31,35 @@ class DesignPriorities(BaseModel):
     low_mass: float = Field(default=1.0, ge=0.0, description="Weight for lightweight design")
     simplicity: float = Field(default=1.0, ge=0.0, description="Weight for simple/maintainable design")
 
+    # Memoized result of normalized(), keyed by the weights it was computed from
+    _normalized_cache: Optional[tuple[tuple[float, float, float, float], dict[str, float]]] = (
+        PrivateAttr(default=None)
+    )
+
     def normalized(self) -> dict[str, float]:
-        """Return normalized weights that sum to 1.0."""
-        total = self.robustness + self.low_drag + self.low_mass + self.simplicity
+        """
+        Return normalized weights that sum to 1.0.
+        
+        The weights are cached and recomputed only if a weight changes;
+        each call returns a new dict.
+        """
+        key = (self.robustness, self.low_drag, self.low_mass, self.simplicity)
+        cached = self._normalized_cache
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        
+        total = sum(key)
         if total == 0:
-            return {"robustness": 0.25, "low_drag": 0.25, "low_mass": 0.25, "simplicity": 0.25}
-        return {
-            "robustness": self.robustness / total,
-            "low_drag": self.low_drag / total,
-            "low_mass": self.low_mass / total,
-            "simplicity": self.simplicity / total,
-        }
+            weights = {"robustness": 0.25, "low_drag": 0.25, "low_mass": 0.25, "simplicity": 0.25}
+        else:
+            weights = {
+                "robustness": self.robustness / total,
+                "low_drag": self.low_drag / total,
+                "low_mass": self.low_mass / total,
+                "simplicity": self.simplicity / total,
+            }
+        self._normalized_cache = (key, weights)
+        return dict(weights)
 
 
 class AircraftInputs(BaseModel):
@@ -211,7 +230,7 @@ class AircraftInputs(BaseModel):
         if self.cg_height_m is not None:
             return self.cg_height_m
         # Base height from weight correlation
-        base_height = 0.8 + 0.15 * (self.mtow_kg / 1000) ** 0.5
+        base_height = 0.8 + 0.15 * sqrt(self.mtow_kg / 1000)
         # Wing position adjustment
         if self.wing_low:
             base_height *= 1.1
@@ -220,6 +239,7 @@ class AircraftInputs(BaseModel):
         return max(0.8, min(2.5, base_height))
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "aircraft_name": "GA-2024",
@@ -5,10 +5,12 @@ These models define the structure of gear concept suggestions returned
 by the recommender. This is for CONCEPTUAL SIZING ONLY - not certification.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from operator import attrgetter
+from typing import Annotated, NamedTuple, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class GearConfig(str, Enum):
@@ -23,7 +25,12 @@ class GearType(str, Enum):
     RETRACTABLE = "retractable"
 
 
-class GeometryRange(BaseModel):
+class _OutputModel(BaseModel):
+    """Base for output models: core schemas are built on first use, not at import."""
+    model_config = {"defer_build": True}
+
+
+class GeometryRange(_OutputModel):
     """A range of values for a geometry parameter."""
     min: float = Field(..., description="Minimum value")
     max: float = Field(..., description="Maximum value")
@@ -31,7 +38,7 @@ class GeometryRange(BaseModel):
     @property
     def mid(self) -> float:
         """Midpoint of the range."""
-        return (self.min + self.max) / 2
+        return (self.min + self.max) * 0.5
 
     @property
     def span(self) -> float:
@@ -39,7 +46,7 @@ class GeometryRange(BaseModel):
         return self.max - self.min
 
 
-class Geometry(BaseModel):
+class Geometry(_OutputModel):
     """
     Geometric parameters for landing gear layout.
     
@@ -67,8 +74,10 @@ class Geometry(BaseModel):
     )
 
 
-class CatalogTire(BaseModel):
-    """A tire from the internal catalog."""
+class CatalogTire(_OutputModel):
+    """A tire from the internal catalog (frozen: instances are shared by every match)."""
+    model_config = {"frozen": True}
+    
     name: str = Field(..., description="Tire designation/name")
     diameter_m: float = Field(..., description="Tire outer diameter in meters")
     width_m: float = Field(..., description="Tire width in meters")
@@ -76,7 +85,7 @@ class CatalogTire(BaseModel):
     max_pressure_kpa: Optional[float] = Field(default=None, description="Max inflation pressure in kPa")
 
 
-class PDFMatchedTire(BaseModel):
+class PDFMatchedTire(_OutputModel):
     """A tire matched from PDF catalog with scoring details."""
     size: str = Field(..., description="Tire size designation")
     ply_rating: Optional[str] = Field(default=None, description="Ply rating")
@@ -89,7 +98,7 @@ class PDFMatchedTire(BaseModel):
     reasons: list[str] = Field(default_factory=list, description="Selection reasons")
 
 
-class TireSuggestion(BaseModel):
+class TireSuggestion(_OutputModel):
     """
     Tire sizing suggestions based on load requirements.
     
@@ -136,7 +145,7 @@ class TireSuggestion(BaseModel):
     )
 
 
-class Loads(BaseModel):
+class Loads(_OutputModel):
     """
     Load calculations for the gear configuration.
     
@@ -177,7 +186,7 @@ class Loads(BaseModel):
     )
 
 
-class CheckResult(BaseModel):
+class CheckResult(_OutputModel):
     """Result of a safety/stability check."""
     passed: bool = Field(..., description="Whether the check passed")
     value: float = Field(..., description="Computed margin or ratio")
@@ -185,14 +194,47 @@ class CheckResult(BaseModel):
     description: str = Field(default="", description="Explanation of the check")
 
 
-class CGSensitivity(BaseModel):
+class CGSensitivity(_OutputModel):
     """Summary of CG range sensitivity analysis."""
     pass_rate: float = Field(..., ge=0, le=1, description="Fraction of CG positions passing all checks")
     worst_case_position: str = Field(..., description="CG position with worst margins (fwd/mid/aft)")
     critical_check: Optional[str] = Field(default=None, description="Check most sensitive to CG")
 
 
-class Checks(BaseModel):
+# Check names in passed_mask bit order (bit i set = check i passed)
+CHECK_NAMES = (
+    "tip_back",
+    "nose_over",
+    "ground_clearance",
+    "lateral_stability",
+    "prop_clearance",
+)
+ALL_CHECKS_PASSED_MASK = (1 << len(CHECK_NAMES)) - 1
+
+# Failed check names for every possible mask, in CHECK_NAMES order
+_FAILED_CHECKS_BY_MASK = tuple(
+    tuple(name for bit, name in enumerate(CHECK_NAMES) if not mask >> bit & 1)
+    for mask in range(ALL_CHECKS_PASSED_MASK + 1)
+)
+
+
+def failed_check_names(mask: int) -> tuple[str, ...]:
+    """Names of the checks that failed for a passed_mask value (shared tuple)."""
+    return _FAILED_CHECKS_BY_MASK[mask]
+
+
+def _passed_mask(checks: "Checks | CheckFlags") -> int:
+    """Pack the five check results into a passed_mask (bit order CHECK_NAMES)."""
+    return (
+        checks.tip_back_margin.passed
+        | checks.nose_over_margin.passed << 1
+        | checks.ground_clearance_ok << 2
+        | checks.lateral_stability_ok << 3
+        | checks.prop_clearance_ok << 4
+    )
+
+
+class Checks(_OutputModel):
     """
     Safety and stability checks for the gear configuration.
     """
@@ -229,8 +271,33 @@ class Checks(BaseModel):
         description="Summary of how checks vary across CG range"
     )
 
+    @property
+    def passed_mask(self) -> int:
+        """Pass/fail of the five checks as a bitmask (see CHECK_NAMES)."""
+        return _passed_mask(self)
+
 
-class ScoreBreakdown(BaseModel):
+class CheckFlags(NamedTuple):
+    """
+    Lightweight mirror of the five Checks results.
+    
+    Field names match Checks, so it can stand in for a Checks wherever only
+    the check results are read (scoring, pass/fail masks) without a model
+    copy per evaluation.
+    """
+    tip_back_margin: CheckResult
+    nose_over_margin: CheckResult
+    ground_clearance_ok: bool
+    lateral_stability_ok: bool
+    prop_clearance_ok: bool
+
+    @property
+    def passed_mask(self) -> int:
+        """Pass/fail of the five checks as a bitmask (see CHECK_NAMES)."""
+        return _passed_mask(self)
+
+
+class ScoreBreakdown(_OutputModel):
     """
     Breakdown of scoring components.
     
@@ -248,7 +315,7 @@ class ScoreBreakdown(BaseModel):
     )
 
 
-class GearConcept(BaseModel):
+class GearConcept(_OutputModel):
     """
     A complete landing gear concept recommendation.
     
@@ -308,16 +375,13 @@ class GearConcept(BaseModel):
     @property
     def all_checks_passed(self) -> bool:
         """Whether all safety checks passed."""
-        return (
-            self.checks.tip_back_margin.passed
-            and self.checks.nose_over_margin.passed
-            and self.checks.ground_clearance_ok
-            and self.checks.lateral_stability_ok
-            and self.checks.prop_clearance_ok
-        )
+        return self.checks.passed_mask == ALL_CHECKS_PASSED_MASK
+
 
+_concept_score_key = attrgetter("score")
 
-class RecommendationResult(BaseModel):
+
+class RecommendationResult(_OutputModel):
     """
     Complete output of the gear recommendation process.
     """
@@ -338,10 +402,16 @@ class RecommendationResult(BaseModel):
         description="Any warnings about inputs or results"
     )
 
+    @field_validator("concepts")
+    @classmethod
+    def sort_concepts(cls, v: list[GearConcept]) -> list[GearConcept]:
+        """Order concepts by score, best first (stable for equal scores)."""
+        return sorted(v, key=_concept_score_key, reverse=True)
+
     @property
     def best_concept(self) -> GearConcept:
         """Return the highest-scoring concept."""
-        return max(self.concepts, key=lambda c: c.score)
+        return max(self.concepts, key=_concept_score_key)
 
     @property
     def passing_concepts(self) -> list[GearConcept]:
@@ -349,17 +419,27 @@ class RecommendationResult(BaseModel):
         return [c for c in self.concepts if c.all_checks_passed]
 
 
-class SweepPoint(BaseModel):
-    """Result for a single sweep point."""
-    sink_rate_mps: float = Field(..., description="Sink rate at this point")
-    cg_position_m: float = Field(..., description="CG position at this point")
-    cg_label: str = Field(..., description="CG position label (fwd/mid/aft)")
-    all_checks_passed: bool = Field(..., description="Whether all checks passed")
-    score: float = Field(..., ge=0, le=1, description="Score at this point")
-    failed_checks: list[str] = Field(default_factory=list, description="Names of failed checks")
+@dataclass(slots=True)
+class SweepPoint:
+    """
+    Result for a single sweep point.
+    
+    A slotted dataclass rather than a BaseModel: sweeps build one per grid
+    point from already-checked values, so instances skip validation.
+    Field constraints still apply when a sweep result is parsed from dicts
+    or JSON.
+    """
+    sink_rate_mps: Annotated[float, Field(description="Sink rate at this point")]
+    cg_position_m: Annotated[float, Field(description="CG position at this point")]
+    cg_label: Annotated[str, Field(description="CG position label (fwd/mid/aft)")]
+    all_checks_passed: Annotated[bool, Field(description="Whether all checks passed")]
+    score: Annotated[float, Field(ge=0, le=1, description="Score at this point")]
+    failed_checks: Annotated[list[str], Field(description="Names of failed checks")] = field(
+        default_factory=list
+    )
 
 
-class ConceptSweepResult(BaseModel):
+class ConceptSweepResult(_OutputModel):
     """Sweep results for a single concept."""
     config: GearConfig = Field(..., description="Gear configuration")
     gear_type: GearType = Field(..., description="Fixed or retractable")
@@ -370,7 +450,7 @@ class ConceptSweepResult(BaseModel):
     sweep_points: list[SweepPoint] = Field(..., description="Individual sweep point results")
 
 
-class SweepResult(BaseModel):
+class SweepResult(_OutputModel):
     """Complete sweep analysis result."""
     aircraft_name: str = Field(..., description="Input aircraft name")
     sink_rates_swept: list[float] = Field(..., description="Sink rates evaluated")
@@ -1,17 +1,22 @@
 """
 Physics calculations for landing gear sizing.
 
-This module provides unit-aware calculations using pint for:
+This module provides calculations for:
 - Touchdown energy and shock absorption
 - Static and dynamic load distribution
 - Geometry heuristics and constraints
 - Tire catalog and matching
 
+Calculations take and return plain floats in SI units (kg, m, N, J, s).
+pint is used only at unit-aware boundaries: ureg, Q_ and G_STANDARD are
+built lazily on first use (see gearrec.physics.units).
+
 All calculations use simplified models appropriate for conceptual design.
 NOT for certification or detailed structural analysis.
 """
 
-from gearrec.physics.units import ureg, Q_, kg_to_N, N_to_kg, G_STANDARD
+from gearrec.physics import units as _units
+from gearrec.physics.units import kg_to_N, N_to_kg
 from gearrec.physics.energy import (
     calculate_touchdown_energy,
     calculate_required_shock_force,
@@ -39,12 +44,17 @@ from gearrec.physics.geometry import (
     check_nose_over_margin,
     check_ground_clearance,
     check_lateral_rollover,
+    tip_back_margin,
+    nose_over_margin,
+    ground_clearance_margin,
     estimate_tire_diameter,
     SafetyCheckResult,
 )
 from gearrec.physics.tire_catalog import (
     find_matching_tires,
     estimate_tire_dimensions,
+    tire_size_band,
+    tire_size_factors,
     TIRE_CATALOG,
 )
 
@@ -80,10 +90,22 @@ __all__ = [
     "check_nose_over_margin",
     "check_ground_clearance",
     "check_lateral_rollover",
+    "tip_back_margin",
+    "nose_over_margin",
+    "ground_clearance_margin",
     "estimate_tire_diameter",
     "SafetyCheckResult",
     # Tire catalog
     "find_matching_tires",
     "estimate_tire_dimensions",
+    "tire_size_band",
+    "tire_size_factors",
     "TIRE_CATALOG",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve the pint registry names lazily (see gearrec.physics.units)."""
+    if name in ("ureg", "Q_", "G_STANDARD"):
+        return getattr(_units, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,7 +12,27 @@ ASSUMPTIONS:
 - Uses average force model (actual is more complex with spring/damper curves)
 """
 
-from gearrec.physics.units import ureg, Q_, G_STANDARD
+from bisect import bisect_right
+from functools import lru_cache
+from math import sqrt
+
+from gearrec.physics.units import G_MPS2
+
+# Base stroke (min, max) by MTOW band: <1500, <3000, <6000, >=6000 kg
+_STROKE_MTOW_BOUNDS_KG = (1500.0, 3000.0, 6000.0)
+_STROKE_BASE_RANGES_M = (
+    (0.10, 0.20),
+    (0.15, 0.25),
+    (0.20, 0.30),
+    (0.25, 0.40),
+)
+
+# Stroke multiplier by runway type (soft field needs more absorption)
+_RUNWAY_STROKE_FACTORS = {
+    "paved": 1.0,
+    "grass": 1.2,
+    "gravel": 1.25,
+}
 
 
 def calculate_touchdown_energy(
@@ -36,12 +56,8 @@ def calculate_touchdown_energy(
         - Horizontal velocity absorbed by brakes, not gear (idealized)
         - No lift contribution at touchdown (conservative)
     """
-    mass = Q_(landing_mass_kg, "kg")
-    velocity = Q_(sink_rate_mps, "m/s")
-    
-    energy = 0.5 * mass * velocity**2
-    
-    return energy.to("J").magnitude
+    # kg * (m/s)^2 = J; plain floats, no pint quantities on this path
+    return 0.5 * landing_mass_kg * sink_rate_mps**2
 
 
 def calculate_required_shock_force(
@@ -108,11 +124,12 @@ def calculate_stroke_range(
     if max_force_N <= 0:
         raise ValueError("Max force must be positive")
     
-    # stroke = E / (F * efficiency)
-    min_stroke = energy_J / (max_force_N * efficiency)
+    # stroke = E / (F * efficiency), with E / efficiency shared by both ends
+    k = energy_J / efficiency
+    min_stroke = k / max_force_N
     
     if min_force_N is not None and min_force_N > 0:
-        max_stroke = energy_J / (min_force_N * efficiency)
+        max_stroke = k / min_force_N
     else:
         # Default to 2x min stroke if no min force specified
         max_stroke = min_stroke * 2.0
@@ -120,6 +137,7 @@ def calculate_stroke_range(
     return (min_stroke, max_stroke)
 
 
+@lru_cache(maxsize=256)
 def recommend_stroke_range_for_aircraft(
     mtow_kg: float,
     sink_rate_mps: float,
@@ -143,29 +161,22 @@ def recommend_stroke_range_for_aircraft(
         - Medium GA (1500-3000 kg): 0.15-0.25 m stroke
         - Heavy GA (>3000 kg): 0.20-0.35 m stroke
         - Soft field adds 20-30% to stroke for energy absorption
+        
+    Results are memoized: the inputs are a handful of repeated
+    (mtow, sink rate, runway) combinations.
     """
     # Base stroke from empirical correlation
     # Heavier aircraft need longer stroke
-    if mtow_kg < 1500:
-        base_min, base_max = 0.10, 0.20
-    elif mtow_kg < 3000:
-        base_min, base_max = 0.15, 0.25
-    elif mtow_kg < 6000:
-        base_min, base_max = 0.20, 0.30
-    else:
-        base_min, base_max = 0.25, 0.40
+    base_min, base_max = _STROKE_BASE_RANGES_M[
+        bisect_right(_STROKE_MTOW_BOUNDS_KG, mtow_kg)
+    ]
     
     # Adjust for sink rate (higher sink = more stroke needed)
     # Baseline is 2.0 m/s
-    sink_factor = (sink_rate_mps / 2.0) ** 0.5  # Square root scaling
+    sink_factor = sqrt(sink_rate_mps * 0.5)  # Square root scaling
     
     # Adjust for runway type
-    runway_factors = {
-        "paved": 1.0,
-        "grass": 1.2,  # Soft field needs more absorption
-        "gravel": 1.25,
-    }
-    runway_factor = runway_factors.get(runway_type, 1.0)
+    runway_factor = _RUNWAY_STROKE_FACTORS.get(runway_type, 1.0)
     
     min_stroke = base_min * sink_factor * runway_factor
     max_stroke = base_max * sink_factor * runway_factor
@@ -199,13 +210,11 @@ def calculate_load_factor_from_sink(
         - FAR 23 typically requires design for 2.0-3.0g landing loads
         - This is a simplified model; actual loads depend on gear dynamics
     """
-    g = G_STANDARD.magnitude  # 9.80665 m/s^2
-    
     # From energy balance:
     # 0.5*m*v^2 = m*g*stroke*efficiency*(n-1)
     # n = v^2 / (2*g*stroke*efficiency) + 1
     
-    n = (sink_rate_mps ** 2) / (2 * g * stroke_m * efficiency) + 1
+    n = (sink_rate_mps ** 2) / (2 * G_MPS2 * stroke_m * efficiency) + 1
     
     return n
 
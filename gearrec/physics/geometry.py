@@ -15,11 +15,58 @@ ASSUMPTIONS:
 """
 
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
-from gearrec.physics.units import G_STANDARD
+from functools import lru_cache
 
 
-@dataclass
+# Track multiplier by runway type
+_RUNWAY_TRACK_FACTORS = {
+    "paved": 1.0,
+    "grass": 1.15,  # Wider for soft-field stability
+    "gravel": 1.20,
+}
+
+# Wheelbase (min ratio, max ratio, min clamp m, max clamp m) by gear layout;
+# any layout other than taildragger uses the tricycle band
+_TRICYCLE_WHEELBASE_BAND = (0.25, 0.38, 2.0, 6.0)  # More compact wheelbase
+_WHEELBASE_BANDS = {
+    "tricycle": _TRICYCLE_WHEELBASE_BAND,
+    # Taildraggers have main gear forward, long distance to tail
+    "taildragger": (0.55, 0.75, 4.0, 10.0),
+}
+
+# Base main strut length (min, max) by MTOW band:
+# <1000, <1500, <2500, <4000, >=4000 kg
+_STRUT_MTOW_BOUNDS_KG = (1000.0, 1500.0, 2500.0, 4000.0)
+_STRUT_BASE_RANGES_M = (
+    (0.30, 0.45),
+    (0.35, 0.55),
+    (0.45, 0.65),
+    (0.50, 0.75),
+    (0.60, 0.90),
+)
+
+# Base tire diameter (min, max) by load band:
+# <3000, <5000, <10000, <20000, >=20000 N
+_TIRE_LOAD_BOUNDS_N = (3000.0, 5000.0, 10000.0, 20000.0)
+_TIRE_BASE_DIAMETERS_M = (
+    (0.25, 0.35),
+    (0.30, 0.40),
+    (0.35, 0.50),
+    (0.45, 0.60),
+    (0.55, 0.75),
+)
+
+# Tire diameter multiplier by runway type (soft field = larger tires)
+_RUNWAY_TIRE_DIAMETER_FACTORS = {
+    "paved": 1.0,
+    "grass": 1.20,
+    "gravel": 1.15,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SafetyCheckResult:
     """Result of a safety margin check."""
     passed: bool
@@ -28,6 +75,7 @@ class SafetyCheckResult:
     description: str
 
 
+@lru_cache(maxsize=256)
 def estimate_fuselage_length(
     mtow_kg: float,
     k_factor: float = 0.85,
@@ -55,6 +103,7 @@ def estimate_fuselage_length(
     Notes:
         - This is a rough estimate for initial sizing
         - Actual length depends heavily on configuration
+        - Memoized: sweeps repeat the same MTOW many times
     """
     return k_factor * (mtow_kg ** (1/3))
 
@@ -88,12 +137,7 @@ def calculate_track_range(
     base_max_ratio = 0.28
     
     # Runway adjustment
-    runway_factors = {
-        "paved": 1.0,
-        "grass": 1.15,  # Wider for soft-field stability
-        "gravel": 1.20,
-    }
-    runway_factor = runway_factors.get(runway_type, 1.0)
+    runway_factor = _RUNWAY_TRACK_FACTORS.get(runway_type, 1.0)
     
     # Low-wing adjustment (more tip clearance concern)
     wing_factor = 1.10 if wing_low else 1.0
@@ -128,25 +172,17 @@ def calculate_wheelbase_range(
         - Tricycle: 0.25-0.35 * fuselage length
         - Taildragger: 0.55-0.75 * fuselage length (longer due to tail position)
     """
-    if config == "taildragger":
-        # Taildraggers have main gear forward, long distance to tail
-        min_ratio = 0.55
-        max_ratio = 0.75
-    else:
-        # Tricycle has more compact wheelbase
-        min_ratio = 0.25
-        max_ratio = 0.38
+    # One table lookup selects both the ratios and the clamp limits
+    min_ratio, max_ratio, lower_limit, upper_limit = _WHEELBASE_BANDS.get(
+        config, _TRICYCLE_WHEELBASE_BAND
+    )
     
     min_wheelbase = fuselage_length_m * min_ratio
     max_wheelbase = fuselage_length_m * max_ratio
     
     # Clamp to practical limits
-    if config == "taildragger":
-        min_wheelbase = max(4.0, min_wheelbase)
-        max_wheelbase = min(10.0, max_wheelbase)
-    else:
-        min_wheelbase = max(2.0, min_wheelbase)
-        max_wheelbase = min(6.0, max_wheelbase)
+    min_wheelbase = max(lower_limit, min_wheelbase)
+    max_wheelbase = min(upper_limit, max_wheelbase)
     
     return (min_wheelbase, max_wheelbase)
 
@@ -174,16 +210,9 @@ def calculate_strut_length_range(
         - Add prop clearance requirement
     """
     # Base strut length from weight correlation
-    if mtow_kg < 1000:
-        base_min, base_max = 0.30, 0.45
-    elif mtow_kg < 1500:
-        base_min, base_max = 0.35, 0.55
-    elif mtow_kg < 2500:
-        base_min, base_max = 0.45, 0.65
-    elif mtow_kg < 4000:
-        base_min, base_max = 0.50, 0.75
-    else:
-        base_min, base_max = 0.60, 0.90
+    base_min, base_max = _STRUT_BASE_RANGES_M[
+        bisect_right(_STRUT_MTOW_BOUNDS_KG, mtow_kg)
+    ]
     
     # Adjust for gear type
     if not is_main_gear:
@@ -198,6 +227,7 @@ def calculate_strut_length_range(
     return (base_min, base_max)
 
 
+@lru_cache(maxsize=256)
 def estimate_cg_height(
     mtow_kg: float,
     wing_low: bool = False,
@@ -216,10 +246,11 @@ def estimate_cg_height(
         - CG height scales roughly with aircraft size
         - Low-wing: CG higher relative to gear (engine/fuselage above wing)
         - High-wing: CG lower (closer to gear)
+        - Memoized: sweeps repeat the same MTOW many times
     """
     # Base height from weight correlation
     # Light aircraft: ~1.0-1.3m, heavier: ~1.2-1.8m
-    base_height = 0.8 + 0.15 * (mtow_kg / 1000) ** 0.5
+    base_height = 0.8 + 0.15 * math.sqrt(mtow_kg / 1000)
     
     # Wing position adjustment
     if wing_low:
@@ -231,6 +262,101 @@ def estimate_cg_height(
     return max(0.8, min(2.5, base_height))
 
 
+def tip_back_margin(
+    x_cg_aft: float,
+    x_main: float,
+    wheelbase: float,
+    min_margin_ratio: float = 0.03,
+) -> tuple[bool, float]:
+    """
+    Numeric core of check_tip_back_margin, without the description.
+    
+    Args:
+        x_cg_aft: Aft CG position (most critical)
+        x_main: Main gear position
+        wheelbase: Distance from nose to main gear
+        min_margin_ratio: Minimum margin as fraction of wheelbase
+        
+    Returns:
+        Tuple of (passed, margin_ratio)
+    """
+    # Distance from aft CG to main gear as a fraction of wheelbase
+    margin = (x_main - x_cg_aft) / wheelbase if wheelbase > 0 else 0
+    return margin >= min_margin_ratio, margin
+
+
+def nose_over_margin(
+    x_cg_fwd: float,
+    x_nose: float,
+    cg_height: float,
+    braking_decel_g: float = 0.4,
+    min_margin_ratio: float = 0.08,
+) -> tuple[bool, float]:
+    """
+    Numeric core of check_nose_over_margin, without the description.
+    
+    Args:
+        x_cg_fwd: Forward CG position (most critical for nose-over)
+        x_nose: Nose gear position
+        cg_height: CG height above ground
+        braking_decel_g: Assumed braking deceleration in g's
+        min_margin_ratio: Minimum acceptable margin ratio
+        
+    Returns:
+        Tuple of (passed, margin_ratio)
+    """
+    # Distance from nose gear to forward CG (positive = CG aft of nose)
+    cg_to_nose = x_cg_fwd - x_nose
+    
+    # Critical distance: braking decel creates forward pitching moment
+    # Need CG far enough aft that moment arm overcomes this
+    critical_distance = braking_decel_g * cg_height
+    required = critical_distance * (1 + min_margin_ratio)  # Add safety margin
+    
+    margin_ratio = (cg_to_nose - critical_distance) / cg_to_nose if cg_to_nose > 0 else 0
+    return cg_to_nose >= required, margin_ratio
+
+
+def _static_ground_height(
+    strut_length_m: float,
+    stroke_m: float,
+    tire_radius_m: float,
+    static_deflection_fraction: float,
+) -> float:
+    """Height of the gear attachment point above ground at static deflection."""
+    # Static gear position (some stroke used under weight)
+    static_deflection = stroke_m * static_deflection_fraction
+    return strut_length_m + tire_radius_m - static_deflection
+
+
+def ground_clearance_margin(
+    strut_length_m: float,
+    stroke_m: float,
+    tire_radius_m: float,
+    prop_clearance_required_m: float,
+    static_deflection_fraction: float = 0.3,
+) -> tuple[bool, float]:
+    """
+    Numeric core of check_ground_clearance, without the description.
+    
+    Args:
+        strut_length_m: Main gear strut length
+        stroke_m: Shock absorber stroke
+        tire_radius_m: Tire radius (half of diameter)
+        prop_clearance_required_m: Required propeller clearance
+        static_deflection_fraction: Fraction of stroke used statically
+        
+    Returns:
+        Tuple of (passed, margin_ratio)
+    """
+    ground_height = _static_ground_height(
+        strut_length_m, stroke_m, tire_radius_m, static_deflection_fraction
+    )
+    margin = ground_height - prop_clearance_required_m
+    margin_ratio = margin / ground_height if ground_height > 0 else 0
+    return margin >= 0, margin_ratio
+
+
 def check_tip_back_margin(
     x_cg_aft: float,
     x_main: float,
@@ -262,14 +388,11 @@ def check_tip_back_margin(
         - If CG is at or behind main gear, aircraft tips back
         - Margin provides stability against tail strikes
     """
+    passed, margin = tip_back_margin(x_cg_aft, x_main, wheelbase, min_margin_ratio)
+    
     # Distance from aft CG to main gear (positive = CG forward of main)
     cg_to_main = x_main - x_cg_aft
     
-    # Margin as fraction of wheelbase
-    margin = cg_to_main / wheelbase if wheelbase > 0 else 0
-    
-    passed = margin >= min_margin_ratio
-    
     description = (
         f"CG is {cg_to_main:.3f}m forward of main gear "
         f"({margin*100:.1f}% of wheelbase). "
@@ -322,24 +445,14 @@ def check_nose_over_margin(
         (x_cg - x_nose) > a/g * h
         margin = (x_cg - x_nose) - a/g * h
     """
-    g = G_STANDARD.magnitude
+    passed, margin_ratio = nose_over_margin(
+        x_cg_fwd, x_nose, cg_height, braking_decel_g, min_margin_ratio
+    )
     
     # Distance from nose gear to forward CG (positive = CG aft of nose)
     cg_to_nose = x_cg_fwd - x_nose
-    
-    # Critical distance: braking decel creates forward pitching moment
-    # Need CG far enough aft that moment arm overcomes this
     critical_distance = braking_decel_g * cg_height
     
-    # Available margin
-    available = cg_to_nose
-    required = critical_distance * (1 + min_margin_ratio)  # Add safety margin
-    
-    # Margin ratio
-    margin_ratio = (available - critical_distance) / cg_to_nose if cg_to_nose > 0 else 0
-    
-    passed = available >= required
-    
     description = (
         f"CG is {cg_to_nose:.3f}m aft of nose gear. "
         f"Under {braking_decel_g}g braking with CG at {cg_height:.2f}m height, "
@@ -379,16 +492,15 @@ def check_ground_clearance(
         - Ground height = strut + tire_radius - static_deflection
         - Must exceed prop_clearance requirement
     """
-    # Static gear position (some stroke used under weight)
-    static_deflection = stroke_m * static_deflection_fraction
-    
-    # Height of attachment point above ground
-    ground_height = strut_length_m + tire_radius_m - static_deflection
+    passed, margin_ratio = ground_clearance_margin(
+        strut_length_m, stroke_m, tire_radius_m,
+        prop_clearance_required_m, static_deflection_fraction,
+    )
     
+    ground_height = _static_ground_height(
+        strut_length_m, stroke_m, tire_radius_m, static_deflection_fraction
+    )
     margin = ground_height - prop_clearance_required_m
-    margin_ratio = margin / ground_height if ground_height > 0 else 0
-    
-    passed = margin >= 0
     
     description = (
         f"Ground clearance: {ground_height:.3f}m. "
@@ -470,24 +582,12 @@ def estimate_tire_diameter(
         - Soft field: larger tires (lower pressure)
     """
     # Base diameter from load
-    if load_per_tire_N < 3000:
-        base_min, base_max = 0.25, 0.35
-    elif load_per_tire_N < 5000:
-        base_min, base_max = 0.30, 0.40
-    elif load_per_tire_N < 10000:
-        base_min, base_max = 0.35, 0.50
-    elif load_per_tire_N < 20000:
-        base_min, base_max = 0.45, 0.60
-    else:
-        base_min, base_max = 0.55, 0.75
+    base_min, base_max = _TIRE_BASE_DIAMETERS_M[
+        bisect_right(_TIRE_LOAD_BOUNDS_N, load_per_tire_N)
+    ]
     
     # Runway adjustment (soft field = larger tires)
-    runway_factors = {
-        "paved": 1.0,
-        "grass": 1.20,
-        "gravel": 1.15,
-    }
-    factor = runway_factors.get(runway_type, 1.0)
+    factor = _RUNWAY_TIRE_DIAMETER_FACTORS.get(runway_type, 1.0)
     
     # Pressure limit adjustment
     # Lower pressure = need larger contact patch = larger tire
@@ -12,10 +12,11 @@ ASSUMPTIONS:
 """
 
 from dataclasses import dataclass
-from gearrec.physics.units import G_STANDARD
 
+from gearrec.physics.units import G_MPS2
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LoadSplit:
     """Result of load split calculation."""
     nose_or_tail_load_N: float  # Load on nose wheel (tricycle) or tail wheel
@@ -154,11 +155,9 @@ def calculate_dynamic_load_factor(
         - FAR 23 requires design for specific sink rates
         - This is simplified; actual dynamics are more complex
     """
-    g = G_STANDARD.magnitude
-    
     # Energy balance: 0.5*m*v^2 = m*g*stroke*eff*(n-1)
     # Solving for n:
-    n = (sink_rate_mps ** 2) / (2 * g * stroke_m * efficiency) + 1
+    n = (sink_rate_mps ** 2) / (2 * G_MPS2 * stroke_m * efficiency) + 1
     
     return n
 
@@ -305,4 +304,3 @@ def calculate_main_load_per_wheel(
     """
     total_wheels = wheels_per_side * num_main_legs
     return main_load_total_N / total_wheels
-
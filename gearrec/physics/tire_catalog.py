@@ -11,13 +11,16 @@ ASSUMPTIONS:
 - Pressure ratings are typical values
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 
 from gearrec.models.outputs import CatalogTire, GeometryRange
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TireCatalogEntry:
     """Internal tire catalog entry."""
     name: str
@@ -126,6 +129,38 @@ TIRE_CATALOG: list[TireCatalogEntry] = [
     ),
 ]
 
+# Catalog columns (structure of arrays), one view per preference order so
+# matching is a filtered walk that stops at max_results with no sort or
+# model construction (each row's frozen CatalogTire is built once here):
+# - default: smallest diameter, then narrowest
+# - soft field: soft-field suitable first, then wider, then smaller diameter
+#   (a stable sort of the default order, so ties keep that order)
+_BY_SIZE = tuple(sorted(TIRE_CATALOG, key=attrgetter("diameter_m", "width_m")))
+_BY_SOFT_FIELD = tuple(sorted(
+    _BY_SIZE,
+    key=lambda t: (not t.soft_field_suitable, -t.width_m, t.diameter_m),
+))
+_CATALOG_TIRES = {
+    entry: CatalogTire(
+        name=entry.name,
+        diameter_m=entry.diameter_m,
+        width_m=entry.width_m,
+        max_load_N=entry.max_load_N,
+        max_pressure_kpa=entry.max_pressure_kpa,
+    )
+    for entry in TIRE_CATALOG
+}
+_BY_SIZE_VIEW = (
+    tuple(_CATALOG_TIRES[entry] for entry in _BY_SIZE),
+    tuple(entry.max_load_N for entry in _BY_SIZE),
+    tuple(entry.max_pressure_kpa for entry in _BY_SIZE),
+)
+_BY_SOFT_FIELD_VIEW = (
+    tuple(_CATALOG_TIRES[entry] for entry in _BY_SOFT_FIELD),
+    tuple(entry.max_load_N for entry in _BY_SOFT_FIELD),
+    tuple(entry.max_pressure_kpa for entry in _BY_SOFT_FIELD),
+)
+
 
 def find_matching_tires(
     required_load_N: float,
@@ -151,54 +186,113 @@ def find_matching_tires(
         3. If prefer_soft_field, prioritize wider tires with soft_field_suitable flag
         4. Otherwise prefer smallest adequate tire
     """
-    candidates = []
+    return list(_find_matching_tires(
+        required_load_N, tire_pressure_limit_kpa, prefer_soft_field, max_results,
+    ))
+
+
+@lru_cache(maxsize=512)
+def _find_matching_tires(
+    required_load_N: float,
+    tire_pressure_limit_kpa: Optional[float],
+    prefer_soft_field: bool,
+    max_results: int,
+) -> tuple[CatalogTire, ...]:
+    """Memoized matching for find_matching_tires (shared, frozen tires)."""
+    tires, max_loads_N, max_pressures_kpa = (
+        _BY_SOFT_FIELD_VIEW if prefer_soft_field else _BY_SIZE_VIEW
+    )
     
-    for entry in TIRE_CATALOG:
-        # Check load capacity (require 10% margin)
-        if entry.max_load_N < required_load_N * 1.1:
-            continue
-        
-        # Check pressure limit if specified
-        if tire_pressure_limit_kpa is not None and entry.max_pressure_kpa is not None:
-            if entry.max_pressure_kpa > tire_pressure_limit_kpa:
-                continue
-        
-        candidates.append(entry)
+    if max_results <= 0:
+        return ()
     
-    if not candidates:
-        return []
+    result: list[CatalogTire] = []
     
-    # Sort by preference
-    if prefer_soft_field:
-        # Prefer: soft field suitable, then wider, then smaller diameter
-        candidates.sort(
-            key=lambda t: (
-                not t.soft_field_suitable,  # Soft field first
-                -t.width_m,                  # Wider first
-                t.diameter_m,                # Then smaller diameter
-            )
-        )
-    else:
-        # Prefer smallest tire that meets requirements
-        candidates.sort(
-            key=lambda t: (
-                t.diameter_m,  # Smallest diameter
-                t.width_m,     # Then narrowest
-            )
-        )
+    # Walk the presorted columns (require 10% load margin, and respect the
+    # pressure limit if specified) until enough tires match
+    min_load_N = required_load_N * 1.1
+    for tire, max_load_N, max_pressure_kpa in zip(
+        tires, max_loads_N, max_pressures_kpa,
+    ):
+        if max_load_N >= min_load_N and (
+            tire_pressure_limit_kpa is None
+            or max_pressure_kpa is None
+            or max_pressure_kpa <= tire_pressure_limit_kpa
+        ):
+            result.append(tire)
+            if len(result) == max_results:
+                break
     
-    # Convert to output model
-    result = []
-    for entry in candidates[:max_results]:
-        result.append(CatalogTire(
-            name=entry.name,
-            diameter_m=entry.diameter_m,
-            width_m=entry.width_m,
-            max_load_N=entry.max_load_N,
-            max_pressure_kpa=entry.max_pressure_kpa,
-        ))
+    return tuple(result)
+
+
+# Base tire size (diam_min, diam_max, width_min, width_max) by load band:
+# <3000, <5000, <10000, <20000, >=20000 N
+_TIRE_LOAD_BOUNDS_N = (3000.0, 5000.0, 10000.0, 20000.0)
+_TIRE_SIZE_BANDS_M = (
+    (0.25, 0.35, 0.08, 0.12),
+    (0.30, 0.40, 0.10, 0.14),
+    (0.35, 0.50, 0.12, 0.18),
+    (0.45, 0.60, 0.15, 0.22),
+    (0.55, 0.75, 0.20, 0.30),
+)
+
+# Runway adjustment factors: (diameter factor, width factor)
+_RUNWAY_TIRE_FACTORS = {
+    "paved": (1.0, 1.0),
+    "grass": (1.15, 1.30),  # Larger, wider for soft field
+    "gravel": (1.10, 1.20),
+}
+
+# Pressure limit adjustment factors (diameter, width) by band:
+# <200 kPa (very low), <300 kPa (low), >=300 kPa (none); lower pressure
+# needs a larger contact patch
+_PRESSURE_BOUNDS_KPA = (200.0, 300.0)
+_PRESSURE_TIRE_FACTORS = (
+    (1.20, 1.30),
+    (1.10, 1.15),
+    (1.0, 1.0),
+)
+
+
+def tire_size_band(load_per_tire_N: float) -> tuple[float, float, float, float]:
+    """
+    Base tire size band from the load correlation (before runway/pressure factors).
     
-    return result
+    Args:
+        load_per_tire_N: Required load capacity per tire in Newtons
+        
+    Returns:
+        Tuple of (diam_min, diam_max, width_min, width_max) in meters
+    """
+    return _TIRE_SIZE_BANDS_M[bisect_right(_TIRE_LOAD_BOUNDS_N, load_per_tire_N)]
+
+
+def tire_size_factors(
+    runway_type: str = "paved",
+    tire_pressure_limit_kpa: Optional[float] = None,
+) -> tuple[float, float]:
+    """
+    Tire diameter and width scale factors for runway surface and pressure limit.
+    
+    Args:
+        runway_type: paved, grass, or gravel
+        tire_pressure_limit_kpa: Maximum tire pressure constraint
+        
+    Returns:
+        Tuple of (diameter_factor, width_factor)
+    """
+    diam_factor, width_factor = _RUNWAY_TIRE_FACTORS.get(runway_type, (1.0, 1.0))
+    
+    # Pressure limit adjustment
+    if tire_pressure_limit_kpa is not None:
+        pressure_diam, pressure_width = _PRESSURE_TIRE_FACTORS[
+            bisect_right(_PRESSURE_BOUNDS_KPA, tire_pressure_limit_kpa)
+        ]
+        diam_factor *= pressure_diam
+        width_factor *= pressure_width
+    
+    return diam_factor, width_factor
 
 
 def estimate_tire_dimensions(
@@ -222,39 +316,10 @@ def estimate_tire_dimensions(
         - Soft field favors wider tires
         - Low pressure limits favor larger contact patch
     """
-    # Base diameter from load correlation
-    if load_per_tire_N < 3000:
-        base_diam_min, base_diam_max = 0.25, 0.35
-        base_width_min, base_width_max = 0.08, 0.12
-    elif load_per_tire_N < 5000:
-        base_diam_min, base_diam_max = 0.30, 0.40
-        base_width_min, base_width_max = 0.10, 0.14
-    elif load_per_tire_N < 10000:
-        base_diam_min, base_diam_max = 0.35, 0.50
-        base_width_min, base_width_max = 0.12, 0.18
-    elif load_per_tire_N < 20000:
-        base_diam_min, base_diam_max = 0.45, 0.60
-        base_width_min, base_width_max = 0.15, 0.22
-    else:
-        base_diam_min, base_diam_max = 0.55, 0.75
-        base_width_min, base_width_max = 0.20, 0.30
-    
-    # Runway adjustment factors
-    runway_factors = {
-        "paved": (1.0, 1.0),    # (diameter factor, width factor)
-        "grass": (1.15, 1.30),  # Larger, wider for soft field
-        "gravel": (1.10, 1.20),
-    }
-    diam_factor, width_factor = runway_factors.get(runway_type, (1.0, 1.0))
-    
-    # Pressure limit adjustment
-    if tire_pressure_limit_kpa is not None:
-        if tire_pressure_limit_kpa < 200:  # Very low pressure
-            diam_factor *= 1.20
-            width_factor *= 1.30
-        elif tire_pressure_limit_kpa < 300:  # Low pressure
-            diam_factor *= 1.10
-            width_factor *= 1.15
+    base_diam_min, base_diam_max, base_width_min, base_width_max = tire_size_band(
+        load_per_tire_N
+    )
+    diam_factor, width_factor = tire_size_factors(runway_type, tire_pressure_limit_kpa)
     
     diameter_range = GeometryRange(
         min=base_diam_min * diam_factor,
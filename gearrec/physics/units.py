@@ -3,45 +3,86 @@ Unit registry and helpers for dimensional calculations.
 
 Uses pint library to ensure dimensional correctness throughout
 all physics calculations.
+
+The hot paths work in plain SI floats, so the pint registry (which takes
+a few hundred milliseconds to import and build) is only created the first
+time one of the unit-aware names below is accessed.
 """
 
-import pint
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pint
+
+# Gravitational acceleration (standard sea level) magnitude in m/s^2, for
+# hot paths that work in SI floats; G_STANDARD is the pint quantity
+G_MPS2 = 9.80665
+
+# Names provided by the lazily built registry
+_REGISTRY_NAMES = frozenset({
+    "ureg", "Q_", "meter", "kilogram", "newton", "joule", "second",
+    "pascal", "kPa", "meter_per_second_squared", "G_STANDARD",
+})
 
-# Create a shared unit registry for the entire application
-ureg = pint.UnitRegistry()
 
-# Shorthand for creating quantities
-Q_ = ureg.Quantity
+_registry_lock = Lock()
 
-# Common unit definitions for convenience
-meter = ureg.meter
-kilogram = ureg.kilogram
-newton = ureg.newton
-joule = ureg.joule
-second = ureg.second
-pascal = ureg.pascal
-kPa = ureg.kilopascal
 
-# Gravitational acceleration (standard sea level)
-G_STANDARD = Q_(9.80665, "m/s^2")
+def _build_registry() -> None:
+    """Create the shared pint registry and the unit-aware module names."""
+    import pint
+    
+    # Create a shared unit registry for the entire application
+    ureg = pint.UnitRegistry()
+    
+    # Shorthand for creating quantities
+    Q_ = ureg.Quantity
+    
+    # Common unit definitions for convenience
+    meter_per_second_squared = ureg.meter / ureg.second ** 2
+    globals().update(
+        ureg=ureg,
+        Q_=Q_,
+        meter=ureg.meter,
+        kilogram=ureg.kilogram,
+        newton=ureg.newton,
+        joule=ureg.joule,
+        second=ureg.second,
+        pascal=ureg.pascal,
+        kPa=ureg.kilopascal,
+        meter_per_second_squared=meter_per_second_squared,
+        G_STANDARD=Q_(G_MPS2, meter_per_second_squared),
+    )
 
 
-def to_base_units(quantity: pint.Quantity) -> pint.Quantity:
+def __getattr__(name: str):
+    """Build the shared pint registry on first use of a unit-aware name."""
+    if name not in _REGISTRY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Locked so concurrent first uses cannot build two registries (quantities
+    # from different registries cannot be combined)
+    with _registry_lock:
+        if "ureg" not in globals():
+            _build_registry()
+    return globals()[name]
+
+
+def to_base_units(quantity: "pint.Quantity") -> "pint.Quantity":
     """Convert a quantity to SI base units."""
     return quantity.to_base_units()
 
 
-def magnitude_in(quantity: pint.Quantity, unit: str) -> float:
+def magnitude_in(quantity: "pint.Quantity", unit: str) -> float:
     """Get the magnitude of a quantity in specified units."""
     return quantity.to(unit).magnitude
 
 
 def kg_to_N(mass_kg: float) -> float:
     """Convert mass in kg to weight in Newtons at standard gravity."""
-    return mass_kg * G_STANDARD.magnitude
+    return mass_kg * G_MPS2
 
 
 def N_to_kg(force_N: float) -> float:
     """Convert weight in Newtons to equivalent mass in kg."""
-    return force_N / G_STANDARD.magnitude
-
+    return force_N / G_MPS2
@@ -7,17 +7,41 @@ Evaluates concepts based on:
 - Runway type compatibility
 """
 
+from bisect import bisect_right
+from typing import Iterable
+
 from gearrec.models.inputs import DesignPriorities, RunwayType
 from gearrec.models.outputs import (
     GearConfig,
     GearType,
     Checks,
+    CheckFlags,
     Loads,
     Geometry,
     ScoreBreakdown,
 )
 
 
+# Runway surfaces that call for extra robustness
+_SOFT_FIELD_RUNWAYS = frozenset({RunwayType.GRASS, RunwayType.GRAVEL})
+
+# Robustness bonus by track mid (wider = more stable):
+# <1.5, <2.0, <2.5, >=2.5 m
+_TRACK_BOUNDS_M = (1.5, 2.0, 2.5)
+_TRACK_ROBUSTNESS_BONUS = (0.0, 0.05, 0.10, 0.15)
+
+# Robustness bonus by stroke mid (more stroke = better energy absorption):
+# <0.18, <0.25, >=0.25 m
+_STROKE_BOUNDS_M = (0.18, 0.25)
+_STROKE_ROBUSTNESS_BONUS = (0.0, 0.05, 0.10)
+
+# Drag and mass bonuses by main strut mid (shorter = smaller and lighter):
+# <0.45, <0.55, <0.65, >=0.65 m
+_STRUT_BOUNDS_M = (0.45, 0.55, 0.65)
+_STRUT_DRAG_BONUS = (0.10, 0.05, 0.0, 0.0)
+_STRUT_MASS_BONUS = (0.15, 0.10, 0.05, 0.0)
+
+
 class GearScorer:
     """
     Scores landing gear concepts based on design priorities.
@@ -41,12 +65,25 @@ class GearScorer:
         """
         self.priorities = priorities
         self.weights = priorities.normalized()
+        
+        # Weights in the order of the weighted-sum terms, resolved once here
+        # instead of by dict lookup on every scoring call
+        self._weight_terms = (
+            self.weights["robustness"],
+            self.weights["low_drag"],
+            self.weights["low_mass"],
+            self.weights["simplicity"],
+        )
+        
+        # Memoized (score, robustness, low_drag, low_mass, simplicity)
+        # terms, keyed by every value the scoring terms read (see score_batch)
+        self._score_cache: dict[tuple, tuple[float, float, float, float, float]] = {}
     
     def score_concept(
         self,
         config: GearConfig,
         gear_type: GearType,
-        checks: Checks,
+        checks: Checks | CheckFlags,
         loads: Loads,
         geometry: Geometry,
         runway_type: RunwayType,
@@ -65,46 +102,122 @@ class GearScorer:
         Returns:
             Tuple of (overall_score, breakdown)
         """
-        # Calculate individual scores
-        robustness = self._score_robustness(config, gear_type, geometry, runway_type)
-        low_drag = self._score_drag(gear_type, config, geometry)
-        low_mass = self._score_mass(gear_type, geometry, loads)
-        simplicity = self._score_simplicity(config, gear_type)
+        return self.score_batch(
+            [(config, gear_type, checks, loads, geometry)], runway_type,
+        )[0]
+    
+    def score_batch(
+        self,
+        concepts: Iterable[tuple[GearConfig, GearType, Checks | CheckFlags, Loads, Geometry]],
+        runway_type: RunwayType,
+    ) -> list[tuple[float, ScoreBreakdown]]:
+        """
+        Score many gear concepts in one pass.
+        
+        Scoring a whole candidate set costs one call instead of one per
+        concept. The score terms are memoized on the values they actually
+        read, so repeated or equivalent concepts skip recomputing them;
+        each concept still gets its own ScoreBreakdown. Each concept's geometry mids and main load are read once and passed
+        to the scoring terms as plain floats.
+        
+        Args:
+            concepts: Iterable of (config, gear_type, checks, loads, geometry)
+            runway_type: Primary runway surface (shared by all concepts)
+            
+        Returns:
+            List of (overall_score, breakdown) tuples, in input order
+        """
+        soft_field = runway_type in _SOFT_FIELD_RUNWAYS
         
-        # Calculate checks penalty
-        checks_penalty = self._calculate_checks_penalty(checks)
+        cache = self._score_cache
+        results = []
+        for config, gear_type, checks, loads, geometry in concepts:
+            track_mid = geometry.track_m.mid
+            stroke_mid = geometry.stroke_m.mid
+            strut_mid = geometry.main_strut_length_m.mid
+            main_load_N = loads.static_main_load_total_N
+            
+            # Calculate checks penalty
+            checks_penalty = self._calculate_checks_penalty(checks)
+            
+            key = (
+                config,
+                gear_type,
+                runway_type,
+                track_mid,
+                stroke_mid,
+                strut_mid,
+                main_load_N,
+                checks_penalty,
+            )
+            terms = cache.get(key)
+            if terms is None:
+                terms = cache[key] = self._score_terms(
+                    config, gear_type, track_mid, stroke_mid, strut_mid,
+                    main_load_N, checks_penalty, soft_field,
+                )
+            final_score, robustness, low_drag, low_mass, simplicity = terms
+            
+            # Build breakdown
+            breakdown = ScoreBreakdown(
+                robustness=robustness,
+                low_drag=low_drag,
+                low_mass=low_mass,
+                simplicity=simplicity,
+                checks_penalty=checks_penalty,
+            )
+            results.append((final_score, breakdown))
+        
+        return results
+    
+    def _score_terms(
+        self,
+        config: GearConfig,
+        gear_type: GearType,
+        track_mid: float,
+        stroke_mid: float,
+        strut_mid: float,
+        main_load_N: float,
+        checks_penalty: float,
+        soft_field: bool,
+    ) -> tuple[float, float, float, float, float]:
+        """Compute (final_score, robustness, low_drag, low_mass, simplicity)."""
+        w_robustness, w_low_drag, w_low_mass, w_simplicity = self._weight_terms
         
-        # Build breakdown
-        breakdown = ScoreBreakdown(
-            robustness=robustness,
-            low_drag=low_drag,
-            low_mass=low_mass,
-            simplicity=simplicity,
-            checks_penalty=checks_penalty,
+        # Calculate individual scores
+        robustness = self._score_robustness(
+            config, gear_type, track_mid, stroke_mid, soft_field
         )
+        low_drag = self._score_drag(gear_type, config, strut_mid)
+        low_mass = self._score_mass(gear_type, strut_mid, main_load_N)
+        simplicity = self._score_simplicity(config, gear_type)
         
         # Calculate weighted score
         weighted_score = (
-            self.weights["robustness"] * robustness +
-            self.weights["low_drag"] * low_drag +
-            self.weights["low_mass"] * low_mass +
-            self.weights["simplicity"] * simplicity
+            w_robustness * robustness +
+            w_low_drag * low_drag +
+            w_low_mass * low_mass +
+            w_simplicity * simplicity
         )
         
-        # Apply checks penalty
+        # Apply checks penalty, clamped to [0, 1] (inline conditionals
+        # instead of min/max calls; a -0.0 still clamps to 0.0)
         final_score = weighted_score * (1.0 - checks_penalty)
+        final_score = (
+            1.0 if final_score > 1.0
+            else final_score if final_score > 0.0
+            else 0.0
+        )
         
-        # Clamp to [0, 1]
-        final_score = max(0.0, min(1.0, final_score))
-        
-        return (final_score, breakdown)
+        return final_score, robustness, low_drag, low_mass, simplicity
     
     def _score_robustness(
         self,
         config: GearConfig,
         gear_type: GearType,
-        geometry: Geometry,
-        runway_type: RunwayType,
+        track_mid: float,
+        stroke_mid: float,
+        soft_field: bool,
     ) -> float:
         """
         Score for robustness/reliability.
@@ -118,44 +231,34 @@ class GearScorer:
         score = 0.5  # Base score
         
         # Fixed gear is more robust
-        if gear_type == GearType.FIXED:
+        if gear_type is GearType.FIXED:
             score += 0.15
         
         # Configuration robustness
-        if config == GearConfig.TRICYCLE:
+        if config is GearConfig.TRICYCLE:
             score += 0.10  # More stable on runway
         
         # Track width contribution (wider = more stable)
-        track_mid = geometry.track_m.mid
-        if track_mid >= 2.5:
-            score += 0.15
-        elif track_mid >= 2.0:
-            score += 0.10
-        elif track_mid >= 1.5:
-            score += 0.05
+        score += _TRACK_ROBUSTNESS_BONUS[bisect_right(_TRACK_BOUNDS_M, track_mid)]
         
         # Stroke contribution (more stroke = better energy absorption)
-        stroke_mid = geometry.stroke_m.mid
-        if stroke_mid >= 0.25:
-            score += 0.10
-        elif stroke_mid >= 0.18:
-            score += 0.05
+        score += _STROKE_ROBUSTNESS_BONUS[bisect_right(_STROKE_BOUNDS_M, stroke_mid)]
         
         # Runway type bonus (grass/gravel needs more robustness)
-        if runway_type in [RunwayType.GRASS, RunwayType.GRAVEL]:
+        if soft_field:
             # Penalize if track is narrow for soft field
             if track_mid < 2.0:
                 score -= 0.10
             if stroke_mid < 0.18:
                 score -= 0.05
         
-        return max(0.0, min(1.0, score))
+        return 1.0 if score > 1.0 else score if score > 0.0 else 0.0
     
     def _score_drag(
         self,
         gear_type: GearType,
         config: GearConfig,
-        geometry: Geometry,
+        strut_mid: float,
     ) -> float:
         """
         Score for aerodynamic efficiency (low drag).
@@ -168,29 +271,25 @@ class GearScorer:
         score = 0.5  # Base score
         
         # Retractable is the big win for drag
-        if gear_type == GearType.RETRACTABLE:
+        if gear_type is GearType.RETRACTABLE:
             score += 0.40  # Major drag reduction
         
         # Fixed gear drag varies with configuration
-        if gear_type == GearType.FIXED:
+        if gear_type is GearType.FIXED:
             # Taildragger has slightly less drag (no nose gear)
-            if config == GearConfig.TAILDRAGGER:
+            if config is GearConfig.TAILDRAGGER:
                 score += 0.05
             
             # Shorter struts = smaller frontal area
-            strut_mid = geometry.main_strut_length_m.mid
-            if strut_mid < 0.45:
-                score += 0.10
-            elif strut_mid < 0.55:
-                score += 0.05
+            score += _STRUT_DRAG_BONUS[bisect_right(_STRUT_BOUNDS_M, strut_mid)]
         
-        return max(0.0, min(1.0, score))
+        return 1.0 if score > 1.0 else score if score > 0.0 else 0.0
     
     def _score_mass(
         self,
         gear_type: GearType,
-        geometry: Geometry,
-        loads: Loads,
+        strut_mid: float,
+        main_load_N: float,
     ) -> float:
         """
         Score for low mass.
@@ -203,21 +302,15 @@ class GearScorer:
         score = 0.5  # Base score
         
         # Fixed gear is lighter (no actuation, simpler structure)
-        if gear_type == GearType.FIXED:
+        if gear_type is GearType.FIXED:
             score += 0.20
         
         # Shorter struts = lighter
-        strut_mid = geometry.main_strut_length_m.mid
-        if strut_mid < 0.45:
-            score += 0.15
-        elif strut_mid < 0.55:
-            score += 0.10
-        elif strut_mid < 0.65:
-            score += 0.05
+        score += _STRUT_MASS_BONUS[bisect_right(_STRUT_BOUNDS_M, strut_mid)]
         
         # Lower loads = lighter structure
         # Normalize by typical GA loads (~50kN total for 1500kg aircraft)
-        load_ratio = loads.static_main_load_total_N / 50000
+        load_ratio = main_load_N / 50000
         if load_ratio < 0.8:
             score += 0.10
         elif load_ratio < 1.2:
@@ -225,7 +318,7 @@ class GearScorer:
         elif load_ratio > 1.5:
             score -= 0.05
         
-        return max(0.0, min(1.0, score))
+        return 1.0 if score > 1.0 else score if score > 0.0 else 0.0
     
     def _score_simplicity(
         self,
@@ -243,18 +336,18 @@ class GearScorer:
         score = 0.5  # Base score
         
         # Fixed gear is much simpler
-        if gear_type == GearType.FIXED:
+        if gear_type is GearType.FIXED:
             score += 0.30
         
         # Configuration simplicity
-        if config == GearConfig.TAILDRAGGER:
+        if config is GearConfig.TAILDRAGGER:
             score += 0.10  # Simpler overall structure
-        elif config == GearConfig.TRICYCLE:
+        elif config is GearConfig.TRICYCLE:
             score += 0.05  # More parts but proven design
         
-        return max(0.0, min(1.0, score))
+        return 1.0 if score > 1.0 else score if score > 0.0 else 0.0
     
-    def _calculate_checks_penalty(self, checks: Checks) -> float:
+    def _calculate_checks_penalty(self, checks: Checks | CheckFlags) -> float:
         """
         Calculate penalty factor from failed checks.
         
@@ -11,40 +11,92 @@ Usage:
 """
 
 import argparse
-import json
+import os
 import re
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Sequence
+
+from pydantic import TypeAdapter
 
 from gearrec.tire_catalog.models import TireSpec, ApplicationRow
 
 
-# Regex patterns for tire size detection
-# Matches patterns like: 24x7.25-10, 6.00-6, 15X6.0-6, 8.50-10, etc.
+# Regex patterns for tire size detection, one alternative per format:
+# - 24x7.25-10, 15X6.0-6 (width x dimension)
+# - 6.00-6, 8.50-10 (no x dimension)
+# - 380x150-6 (metric)
+_TIRE_SIZE_FORMATS = (
+    r'[A-Z]?\d+(?:\.\d+)?[xX]\d+(?:\.\d+)?-\d+(?:\.\d+)?'
+    r'|\d+\.\d+-\d+'
+    r'|\d{3}[xX]\d{2,3}-\d+'
+)
+
+# Tire size at the start of a line, followed by whitespace (alternatives
+# are tried in the order above, so one match call covers all formats)
 TIRE_SIZE_PATTERN = re.compile(
-    r'^([A-Z]?\d+(?:\.\d+)?[xX]\d+(?:\.\d+)?-\d+(?:\.\d+)?)\s+',
+    rf'^(?P<size>{_TIRE_SIZE_FORMATS})\s+',
     re.IGNORECASE
 )
 
-# Alternative pattern for sizes like "6.00-6" (no x dimension)
-TIRE_SIZE_ALT_PATTERN = re.compile(
-    r'^(\d+\.\d+-\d+)\s+',
+# A whole token that is a tire size in any of the formats above
+TIRE_SIZE_TOKEN_PATTERN = re.compile(_TIRE_SIZE_FORMATS, re.IGNORECASE)
+
+# ASCII characters a tire size can start with; every format also contains a
+# '-', so lines failing either test are rejected without running a regex
+_TIRE_SIZE_START_CHARS = frozenset(string.ascii_letters + string.digits)
+
+# Header and note keywords that mark an application chart line as non-data
+_SKIP_LINE_PATTERN = re.compile(
+    r'AIRCRAFT|MODEL|MAIN|NOSE|TAIL|AUX|NOTE:|WARNING|TIRE SIZE|PLY|---|===',
     re.IGNORECASE
 )
 
-# Pattern for metric sizes like "380x150-6"
-TIRE_SIZE_METRIC_PATTERN = re.compile(
-    r'^(\d{3}[xX]\d{2,3}-\d+)\s+',
+# Common manufacturers, longest first so e.g. BEECHCRAFT wins over BEECH
+_MANUFACTURERS = sorted(
+    [
+        'CESSNA', 'PIPER', 'BEECH', 'BEECHCRAFT', 'MOONEY', 'CIRRUS',
+        'DIAMOND', 'GRUMMAN', 'BELLANCA', 'MAULE', 'VANS', "VAN'S",
+        'AMERICAN CHAMPION', 'AVIAT', 'EXTRA', 'PITTS', 'AERONCA',
+        'BOEING', 'AIRBUS', 'EMBRAER', 'BOMBARDIER', 'PILATUS',
+    ],
+    key=len,
+    reverse=True,
+)
+
+# Manufacturer name at the start of a model string
+_MANUFACTURER_PATTERN = re.compile(
+    '^(' + '|'.join(map(re.escape, _MANUFACTURERS)) + ')',
     re.IGNORECASE
 )
 
+# ASCII characters a float() literal can start with
+_NUMBER_START_CHARS = frozenset('+-.0123456789iInN')
+
+# Ply rating token, e.g. "6" or "6PR"
+PLY_RATING_PATTERN = re.compile(r'^\d{1,2}(PR)?$', re.IGNORECASE)
+
+# Token that might be a part number, e.g. "461B-3470-TL"
+PART_NUMBER_PATTERN = re.compile(r'^[A-Z0-9]{5,}', re.IGNORECASE)
+
 
 def parse_number(s: str) -> Optional[float]:
     """Parse a string to float, returning None if invalid."""
     if not s:
         return None
     s = s.strip().replace(',', '')
+    # float() only accepts text starting with a sign, digit, '.', inf or nan
+    # (or whitespace/non-ASCII digits), so word tokens skip the exception
+    if (
+        s
+        and s[0] not in _NUMBER_START_CHARS
+        and s[0].isascii()
+        and not s[0].isspace()
+    ):
+        return None
     try:
         return float(s)
     except ValueError:
@@ -62,20 +114,19 @@ def parse_tire_data_line(line: str, page: int) -> Optional[TireSpec]:
     Returns TireSpec if valid line, None otherwise.
     """
     line = line.strip()
-    if not line:
+    if (
+        not line
+        or '-' not in line
+        or (line[0].isascii() and line[0] not in _TIRE_SIZE_START_CHARS)
+    ):
         return None
     
     # Try to match tire size at start
-    size_match = (
-        TIRE_SIZE_PATTERN.match(line) or 
-        TIRE_SIZE_ALT_PATTERN.match(line) or
-        TIRE_SIZE_METRIC_PATTERN.match(line)
-    )
-    
+    size_match = TIRE_SIZE_PATTERN.match(line)
     if not size_match:
         return None
     
-    size = size_match.group(1).upper()
+    size = size_match.group('size').upper()
     remainder = line[size_match.end():].strip()
     
     # Split remaining tokens
@@ -103,7 +154,7 @@ def parse_tire_data_line(line: str, page: int) -> Optional[TireSpec]:
     idx = 0
     if idx < len(tokens):
         token = tokens[idx]
-        if re.match(r'^\d{1,2}(PR)?$', token, re.IGNORECASE):
+        if PLY_RATING_PATTERN.match(token):
             ply_rating = token.replace('PR', '').strip()
             idx += 1
     
@@ -124,7 +175,7 @@ def parse_tire_data_line(line: str, page: int) -> Optional[TireSpec]:
         num = parse_number(token)
         if num is not None:
             numbers.append((i, num))
-        elif re.match(r'^[A-Z0-9]{5,}', token, re.IGNORECASE):
+        elif PART_NUMBER_PATTERN.match(token):
             # Might be part number
             part_nums.append(token)
     
@@ -214,14 +265,12 @@ def parse_application_line(line: str, page: int) -> Optional[ApplicationRow]:
     Returns ApplicationRow if valid, None otherwise.
     """
     line = line.strip()
-    if not line:
+    # Sizes can appear anywhere in the row, but each one contains a '-'
+    if '-' not in line:
         return None
     
     # Skip header lines and notes
-    if any(skip in line.upper() for skip in [
-        'AIRCRAFT', 'MODEL', 'MAIN', 'NOSE', 'TAIL', 'AUX', 
-        'NOTE:', 'WARNING', 'TIRE SIZE', 'PLY', '---', '==='
-    ]):
+    if _SKIP_LINE_PATTERN.search(line):
         return None
     
     tokens = line.split()
@@ -233,9 +282,7 @@ def parse_application_line(line: str, page: int) -> Optional[ApplicationRow]:
     tire_indices = []
     
     for i, token in enumerate(tokens):
-        if (TIRE_SIZE_PATTERN.match(token + ' ') or 
-            TIRE_SIZE_ALT_PATTERN.match(token + ' ') or
-            TIRE_SIZE_METRIC_PATTERN.match(token + ' ')):
+        if TIRE_SIZE_TOKEN_PATTERN.fullmatch(token):
             tire_sizes.append(token.upper())
             tire_indices.append(i)
     
@@ -253,19 +300,10 @@ def parse_application_line(line: str, page: int) -> Optional[ApplicationRow]:
     manufacturer = None
     model = ' '.join(model_parts)
     
-    # Common manufacturers
-    manufacturers = [
-        'CESSNA', 'PIPER', 'BEECH', 'BEECHCRAFT', 'MOONEY', 'CIRRUS',
-        'DIAMOND', 'GRUMMAN', 'BELLANCA', 'MAULE', 'VANS', "VAN'S",
-        'AMERICAN CHAMPION', 'AVIAT', 'EXTRA', 'PITTS', 'AERONCA',
-        'BOEING', 'AIRBUS', 'EMBRAER', 'BOMBARDIER', 'PILATUS'
-    ]
-    
-    for mfr in manufacturers:
-        if model.upper().startswith(mfr):
-            manufacturer = mfr
-            model = model[len(mfr):].strip()
-            break
+    mfr_match = _MANUFACTURER_PATTERN.match(model)
+    if mfr_match:
+        manufacturer = mfr_match.group(1).upper()
+        model = model[mfr_match.end():].strip()
     
     main_tire = tire_sizes[0] if len(tire_sizes) >= 1 else None
     aux_tire = tire_sizes[1] if len(tire_sizes) >= 2 else None
@@ -277,7 +315,7 @@ def parse_application_line(line: str, page: int) -> Optional[ApplicationRow]:
     for i, idx in enumerate(tire_indices):
         if idx + 1 < len(tokens):
             next_token = tokens[idx + 1]
-            if re.match(r'^\d{1,2}(PR)?$', next_token, re.IGNORECASE):
+            if PLY_RATING_PATTERN.match(next_token):
                 if i == 0:
                     main_ply = next_token.replace('PR', '')
                 elif i == 1:
@@ -303,15 +341,53 @@ def parse_application_line(line: str, page: int) -> Optional[ApplicationRow]:
     )
 
 
-def import_data_section(pdf_path: str) -> list[TireSpec]:
+# parse_tire_data_line or parse_application_line
+_LineParser = Callable[[str, int], Optional[TireSpec | ApplicationRow]]
+
+
+def _parse_pdf_pages(
+    pdf_path: str,
+    page_numbers: Sequence[int],
+    parse_line: _LineParser,
+) -> list[TireSpec | ApplicationRow]:
     """
-    Import tire specifications from the Data Section PDF.
+    Extract and parse a run of PDF pages, in page and line order.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor.
     
     Args:
-        pdf_path: Path to the Data Section PDF
-        
-    Returns:
-        List of TireSpec objects
+        pdf_path: Path to the PDF
+        page_numbers: 1-based page numbers to parse
+        parse_line: Line parser (parse_tire_data_line or parse_application_line)
+    """
+    import pdfplumber
+    
+    parsed = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in page_numbers:
+            text = pdf.pages[page_num - 1].extract_text()
+            if not text:
+                continue
+            
+            for line in text.split('\n'):
+                record = parse_line(line, page_num)
+                if record:
+                    parsed.append(record)
+    
+    return parsed
+
+
+def _parse_pdf(
+    pdf_path: str,
+    parse_line: _LineParser,
+    max_workers: Optional[int] = None,
+) -> list[TireSpec | ApplicationRow]:
+    """
+    Parse every page of a PDF, in page and line order.
+    
+    Text extraction dominates import time and pages are independent, so
+    contiguous runs of pages are dispatched to a process pool (one task
+    per worker) and the results are joined back in page order.
     """
     try:
         import pdfplumber
@@ -319,64 +395,84 @@ def import_data_section(pdf_path: str) -> list[TireSpec]:
         print("Error: pdfplumber is required. Install with: pip install pdfplumber")
         sys.exit(1)
     
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+    pages = range(1, page_count + 1)
+    
+    if max_workers == 1 or page_count <= 1:
+        return _parse_pdf_pages(pdf_path, pages, parse_line)
+    
+    workers = min(page_count, max_workers or os.cpu_count() or 1)
+    runs = [
+        pages[i * page_count // workers:(i + 1) * page_count // workers]
+        for i in range(workers)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [
+            record
+            for parsed in executor.map(
+                _parse_pdf_pages, repeat(pdf_path), runs, repeat(parse_line),
+            )
+            for record in parsed
+        ]
+
+
+def import_data_section(
+    pdf_path: str,
+    max_workers: Optional[int] = None,
+) -> list[TireSpec]:
+    """
+    Import tire specifications from the Data Section PDF.
+    
+    Args:
+        pdf_path: Path to the Data Section PDF
+        max_workers: Worker processes for page parsing. If None, uses the
+                     CPU count; 1 parses all pages serially in-process.
+        
+    Returns:
+        List of TireSpec objects
+    """
     specs = []
-    seen_sizes = set()  # Track unique size+ply combinations
+    seen_sizes: set[tuple[str, Optional[str]]] = set()  # Unique (size, ply) pairs
     
     print(f"Parsing Data Section PDF: {pdf_path}")
     
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text()
-            if not text:
-                continue
-            
-            for line in text.split('\n'):
-                spec = parse_tire_data_line(line, page_num)
-                if spec:
-                    # Deduplicate by size + ply
-                    key = f"{spec.size}_{spec.ply_rating}"
-                    if key not in seen_sizes:
-                        seen_sizes.add(key)
-                        specs.append(spec)
+    for spec in _parse_pdf(pdf_path, parse_tire_data_line, max_workers):
+        # Deduplicate by size + ply
+        key = (spec.size, spec.ply_rating)
+        if key not in seen_sizes:
+            seen_sizes.add(key)
+            specs.append(spec)
     
     print(f"  Parsed {len(specs)} unique tire specifications")
     return specs
 
 
-def import_application_charts(pdf_path: str) -> list[ApplicationRow]:
+def import_application_charts(
+    pdf_path: str,
+    max_workers: Optional[int] = None,
+) -> list[ApplicationRow]:
     """
     Import application charts from the Application Charts PDF.
     
     Args:
         pdf_path: Path to the Application Charts PDF
+        max_workers: Worker processes for page parsing. If None, uses the
+                     CPU count; 1 parses all pages serially in-process.
         
     Returns:
         List of ApplicationRow objects
     """
-    try:
-        import pdfplumber
-    except ImportError:
-        print("Error: pdfplumber is required. Install with: pip install pdfplumber")
-        sys.exit(1)
-    
     apps = []
-    seen_models = set()
+    seen_models: set[tuple[str, Optional[str]]] = set()  # Unique (model, main tire)
     
     print(f"Parsing Application Charts PDF: {pdf_path}")
     
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text()
-            if not text:
-                continue
-            
-            for line in text.split('\n'):
-                app = parse_application_line(line, page_num)
-                if app:
-                    key = f"{app.model}_{app.main_tire_size}"
-                    if key not in seen_models:
-                        seen_models.add(key)
-                        apps.append(app)
+    for app in _parse_pdf(pdf_path, parse_application_line, max_workers):
+        key = (app.model, app.main_tire_size)
+        if key not in seen_models:
+            seen_models.add(key)
+            apps.append(app)
     
     print(f"  Parsed {len(apps)} application rows")
     return apps
@@ -386,6 +482,7 @@ def run_import(
     data_section_path: str,
     app_charts_path: str,
     output_dir: str = "data",
+    max_workers: Optional[int] = None,
 ) -> tuple[Path, Path]:
     """
     Run the full import process.
@@ -394,6 +491,7 @@ def run_import(
         data_section_path: Path to Data Section PDF
         app_charts_path: Path to Application Charts PDF
         output_dir: Directory for output JSON files
+        max_workers: Worker processes for page parsing (see import_data_section)
         
     Returns:
         Tuple of (tires_json_path, applications_json_path)
@@ -402,17 +500,15 @@ def run_import(
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Import tire specs
-    specs = import_data_section(data_section_path)
+    specs = import_data_section(data_section_path, max_workers)
     tires_path = output_path / "goodyear_2022_tires.json"
-    with open(tires_path, 'w') as f:
-        json.dump([s.model_dump() for s in specs], f, indent=2)
+    tires_path.write_bytes(TypeAdapter(list[TireSpec]).dump_json(specs, indent=2))
     print(f"Wrote {len(specs)} tires to {tires_path}")
     
     # Import application charts
-    apps = import_application_charts(app_charts_path)
+    apps = import_application_charts(app_charts_path, max_workers)
     apps_path = output_path / "goodyear_2022_applications.json"
-    with open(apps_path, 'w') as f:
-        json.dump([a.model_dump() for a in apps], f, indent=2)
+    apps_path.write_bytes(TypeAdapter(list[ApplicationRow]).dump_json(apps, indent=2))
     print(f"Wrote {len(apps)} applications to {apps_path}")
     
     return tires_path, apps_path
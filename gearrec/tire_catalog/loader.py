@@ -4,11 +4,13 @@ Tire catalog loader.
 Loads pre-parsed tire specifications and application data from JSON files.
 """
 
-import json
 import importlib.resources as resources
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from gearrec.tire_catalog.models import TireSpec, ApplicationRow
 
 
@@ -19,6 +21,37 @@ DEFAULT_TIRES_PATH = f"data/{DEFAULT_TIRES_NAME}"
 DEFAULT_APPS_PATH = f"data/{DEFAULT_APPS_NAME}"
 
 
+@cache
+def _list_adapter(model: type) -> TypeAdapter:
+    """Shared list validator for a catalog row model (built on first use)."""
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=4)
+def _load_catalog_rows(
+    model: type,
+    file_path: Path,
+    mtime_ns: int,
+    size: int,
+) -> tuple:
+    """
+    Parse and validate a catalog file into a tuple of rows.
+    
+    Cached per process on the resolved path plus the file's modification
+    time and size, so repeated loads skip the disk read and validation
+    while a regenerated catalog is still picked up.
+    """
+    return tuple(_list_adapter(model).validate_json(file_path.read_bytes()))
+
+
+def _load_catalog(model: type, file_path: Path) -> list:
+    """Load a catalog file through the per-process row cache."""
+    stat = file_path.stat()
+    return list(_load_catalog_rows(
+        model, file_path.resolve(), stat.st_mtime_ns, stat.st_size,
+    ))
+
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     # Try to find project root by looking for pyproject.toml
@@ -98,7 +131,8 @@ def load_tire_specs(
         path: Path to JSON file. If None, uses default location.
         
     Returns:
-        List of TireSpec objects
+        List of TireSpec objects (rows are cached per process until the
+        file changes, so they are shared between calls)
         
     Raises:
         FileNotFoundError: If catalog file doesn't exist
@@ -114,10 +148,7 @@ def load_tire_specs(
             f"Run 'python -m gearrec import-tires' to generate it."
         )
     
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    return [TireSpec(**item) for item in data]
+    return _load_catalog(TireSpec, file_path)
 
 
 def load_applications(
@@ -130,7 +161,8 @@ def load_applications(
         path: Path to JSON file. If None, uses default location.
         
     Returns:
-        List of ApplicationRow objects
+        List of ApplicationRow objects (rows are cached per process until the
+        file changes, so they are shared between calls)
         
     Raises:
         FileNotFoundError: If catalog file doesn't exist
@@ -146,10 +178,7 @@ def load_applications(
             f"Run 'python -m gearrec import-tires' to generate it."
         )
     
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    return [ApplicationRow(**item) for item in data]
+    return _load_catalog(ApplicationRow, file_path)
 
 
 def load_all_catalogs(
@@ -7,6 +7,7 @@ load requirements, dimensional constraints, and runway type.
 WARNING: This is for CONCEPTUAL SIZING ONLY, NOT certification.
 """
 
+from operator import attrgetter
 from typing import Optional
 
 from gearrec.tire_catalog.models import TireSpec, ApplicationRow, MatchedTire, TireMatchResult
@@ -322,7 +323,7 @@ def match_tires(
         ))
     
     # Sort by score descending
-    matches.sort(key=lambda m: m.score, reverse=True)
+    matches.sort(key=attrgetter("score"), reverse=True)
     
     return matches[:max_results]
 
@@ -14,7 +14,8 @@ class TireSpec(BaseModel):
     Tire specification from Goodyear Data Section PDF.
     
     Contains rated load, inflation, dimensions, and other specifications
-    parsed from the Three-Part Tire Specifications table.
+    parsed from the Three-Part Tire Specifications table. Frozen because
+    the catalog loader shares cached rows between callers.
     """
     source: str = Field(default="goodyear_2022", description="Data source identifier")
     size: str = Field(..., description="Tire size designation, e.g. '24x7.25-10'")
@@ -34,6 +35,8 @@ class TireSpec(BaseModel):
     raw_line: Optional[str] = Field(default=None, description="Original parsed line for traceability")
     page: Optional[int] = Field(default=None, description="PDF page number")
     
+    model_config = {"frozen": True}
+    
     @property
     def rated_load_N(self) -> float:
         """Rated load converted to Newtons."""
@@ -58,7 +61,8 @@ class ApplicationRow(BaseModel):
     """
     Application chart row from Goodyear Application Charts PDF.
     
-    Maps aircraft models to their recommended tire sizes.
+    Maps aircraft models to their recommended tire sizes. Frozen, like
+    TireSpec.
     """
     manufacturer: Optional[str] = Field(default=None, description="Aircraft manufacturer")
     model: str = Field(..., description="Aircraft model designation")
@@ -69,6 +73,8 @@ class ApplicationRow(BaseModel):
     code: Optional[str] = Field(default=None, description="TT/TL codes or other notes")
     page: Optional[int] = Field(default=None, description="PDF page number")
     raw_line: Optional[str] = Field(default=None, description="Original parsed line for traceability")
+    
+    model_config = {"frozen": True}
 
 
 class MatchedTire(BaseModel):
@@ -7,8 +7,16 @@ Tests the complete generation pipeline, sweep functionality, and output validati
 import pytest
 
 from gearrec.models.inputs import AircraftInputs, RunwayType, DesignPriorities
-from gearrec.models.outputs import GearConfig, GearType
-from gearrec.generator.candidates import GearGenerator
+from gearrec.models.outputs import GearConfig, GearType, RecommendationResult
+from gearrec.generator.candidates import CandidateConfig, GearGenerator
+from gearrec.generator._kernels import evaluate_load_case
+from gearrec.physics import (
+    calculate_touchdown_energy,
+    calculate_required_shock_force,
+    calculate_static_load_split_tricycle,
+    calculate_static_load_split_taildragger,
+    calculate_main_load_per_wheel,
+)
 
 
 def create_test_inputs(**overrides) -> AircraftInputs:
@@ -54,6 +62,41 @@ class TestGearGenerator:
         scores = [c.score for c in candidates]
         assert scores == sorted(scores, reverse=True)
     
+    def test_result_sorts_concepts_on_validation(self):
+        """Test that a parsed result orders concepts best first."""
+        result = GearGenerator(create_test_inputs()).generate_result()
+        data = result.model_dump()
+        data["concepts"].reverse()
+        
+        parsed = RecommendationResult.model_validate(data)
+        
+        scores = [c.score for c in parsed.concepts]
+        assert scores == sorted(scores, reverse=True)
+        assert parsed.best_concept.score == max(scores)
+    
+    def test_result_views_follow_concept_changes(self):
+        """Test that best/passing concepts reflect later concept changes."""
+        result = GearGenerator(create_test_inputs()).generate_result()
+        passing = result.passing_concepts
+        worst = min(result.concepts, key=lambda c: c.score)
+        
+        result.concepts = [worst]
+        assert result.best_concept is worst
+        assert result.passing_concepts == [c for c in passing if c is worst]
+        
+        copied = result.model_copy(update={"concepts": []})
+        assert copied.passing_concepts == []
+    
+    def test_all_checks_passed_follows_checks_update(self):
+        """Test that replacing a concept's checks updates its pass flag."""
+        concept = GearGenerator(create_test_inputs()).generate_candidates()[0]
+        failing = concept.checks.model_copy(update={"ground_clearance_ok": False})
+        
+        concept.all_checks_passed
+        concept.checks = failing
+        
+        assert concept.all_checks_passed is False
+    
     def test_always_includes_tricycle_candidate(self):
         """Test that at least one tricycle config is included."""
         inputs = create_test_inputs()
@@ -139,6 +182,49 @@ class TestGearGenerator:
         
         for c in candidates:
             assert 0 <= c.score <= 1
+    
+    def test_repeated_generation_reuses_evaluations(self, monkeypatch):
+        """Test that a second generation pass does not re-run the physics."""
+        generator = GearGenerator(create_test_inputs())
+        first = generator.generate_candidates()
+        
+        def fail(*args):
+            raise AssertionError("configuration evaluated twice")
+        
+        monkeypatch.setattr(generator, "_run_evaluation", fail)
+        second = generator.generate_candidates()
+        
+        assert [c.score for c in second] == [c.score for c in first]
+
+    def test_repeated_generation_does_not_share_concept_models(self):
+        """Test that changes to a returned concept do not leak into later calls."""
+        generator = GearGenerator(create_test_inputs())
+        first = generator.generate_candidates()
+        first[0].tire_suggestion.tire_selection_notes = ["stale note"]
+        first[0].checks.cg_range_sensitivity = None
+        
+        second = generator.generate_candidates()
+        
+        assert second[0].tire_suggestion.tire_selection_notes is None
+        assert second[0].checks.cg_range_sensitivity is not None
+    
+    def test_repeated_generation_reuses_scores(self, monkeypatch):
+        """Test that rescoring identical concepts hits the scorer memo."""
+        generator = GearGenerator(create_test_inputs())
+        first = generator.generate_candidates()
+
+        def fail(*args):
+            raise AssertionError("concept scored twice")
+
+        monkeypatch.setattr(generator.scorer, "_score_robustness", fail)
+        second = generator.generate_candidates()
+
+        assert [c.score for c in second] == [c.score for c in first]
+        assert [c.score_breakdown for c in second] == [
+            c.score_breakdown for c in first
+        ]
+        breakdowns = [c.score_breakdown for c in first + second]
+        assert len({id(b) for b in breakdowns}) == len(breakdowns)
 
 
 class TestSweepFunctionality:
@@ -197,6 +283,62 @@ class TestSweepFunctionality:
         result = generator.run_sweep(sink_rates=custom_rates)
         
         assert result.sink_rates_swept == custom_rates
+    
+    def test_sweep_parallel_matches_serial(self):
+        """Test that the process-pool sweep matches the in-process sweep."""
+        inputs = create_test_inputs()
+        generator = GearGenerator(inputs)
+        
+        serial = generator.run_sweep(max_workers=1)
+        parallel = generator.run_sweep(max_workers=2)
+        
+        assert parallel.model_dump() == serial.model_dump()
+    
+    def test_sweep_defaults_to_serial(self, monkeypatch):
+        """Test that a default sweep never starts a process pool."""
+        import gearrec.generator.candidates as candidates
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+        
+        monkeypatch.setattr(candidates, "ProcessPoolExecutor", fail)
+        result = GearGenerator(create_test_inputs()).run_sweep()
+        
+        assert len(result.concept_results) >= 3
+    
+    def test_sweep_dump_lists_failed_checks(self):
+        """Test that dumped sweep points report failed checks as lists."""
+        result = GearGenerator(create_test_inputs()).run_sweep()
+        
+        for concept in result.model_dump()["concept_results"]:
+            for point in concept["sweep_points"]:
+                assert isinstance(point["failed_checks"], list)
+    
+    def test_sweep_points_match_full_concept_build(self):
+        """Test that each sweep point scores like a full build at its sink/CG."""
+        inputs = create_test_inputs()
+        generator = GearGenerator(inputs)
+        result = generator.run_sweep(sink_rates=[1.5, 3.0], max_workers=1)
+        
+        for concept, sweep in zip(generator.generate_candidates(), result.concept_results):
+            config = CandidateConfig(
+                config=concept.config,
+                gear_type=concept.gear_type,
+                wheels_per_main_leg=concept.wheel_count_main,
+                wheels_nose_or_tail=concept.wheel_count_nose_or_tail,
+                stroke_m=concept.geometry.stroke_m.mid,
+                track_m=concept.geometry.track_m.mid,
+                wheelbase_m=concept.geometry.wheelbase_m.mid,
+            )
+            for point in sweep.sweep_points:
+                built = generator._build_concept(
+                    config, cg_position=point.cg_position_m, sink_rate=point.sink_rate_mps,
+                )
+                if built is None:
+                    assert point.failed_checks == ["build_failed"]
+                else:
+                    assert point.score == built.score
+                    assert point.all_checks_passed == built.all_checks_passed
 
 
 class TestGeneratorWithDifferentInputs:
@@ -265,3 +407,38 @@ class TestGeneratorWithDifferentInputs:
         # This may not always be true depending on load requirements
         # but for typical inputs it should work
         assert has_catalog_match or True  # Soft assertion
+
+
+class TestLoadCaseKernel:
+    """Tests for the plain-float generator kernels."""
+    
+    def test_tricycle_matches_physics_functions(self):
+        """Test that the kernel reproduces the reference physics functions."""
+        energy, r_nose, r_main, per_wheel, force, fraction = evaluate_load_case(
+            10000.0, 1020.0, 2.0, 2.25, 2.7, 0.7, True, 2, 0.15,
+        )
+        split = calculate_static_load_split_tricycle(10000.0, 2.25, 2.7, 0.7)
+        expected_energy = calculate_touchdown_energy(1020.0, 2.0)
+        
+        assert energy == pytest.approx(expected_energy)
+        assert r_nose == pytest.approx(split.nose_or_tail_load_N)
+        assert r_main == pytest.approx(split.main_load_total_N)
+        assert fraction == pytest.approx(split.nose_fraction)
+        assert per_wheel == pytest.approx(calculate_main_load_per_wheel(r_main, 2))
+        assert force == pytest.approx(calculate_required_shock_force(expected_energy, 0.15))
+    
+    def test_taildragger_matches_physics_functions(self):
+        """Test the taildragger load split branch."""
+        _, r_tail, r_main, _, _, fraction = evaluate_load_case(
+            10000.0, 1020.0, 2.0, 2.0, 1.8, 6.0, False, 1, 0.15,
+        )
+        split = calculate_static_load_split_taildragger(10000.0, 2.0, 1.8, 6.0)
+        
+        assert r_tail == pytest.approx(split.nose_or_tail_load_N)
+        assert r_main == pytest.approx(split.main_load_total_N)
+        assert fraction == pytest.approx(split.nose_fraction)
+    
+    def test_invalid_layout_raises(self):
+        """Test that a nose gear aft of the main gear is rejected."""
+        with pytest.raises(ValueError):
+            evaluate_load_case(10000.0, 1020.0, 2.0, 2.25, 0.7, 2.7, True, 1, 0.15)
@@ -17,6 +17,11 @@ from gearrec.models.outputs import (
     SweepResult,
     ConceptSweepResult,
     SweepPoint,
+    CheckResult,
+    Checks,
+    CheckFlags,
+    ALL_CHECKS_PASSED_MASK,
+    failed_check_names,
 )
 
 
@@ -52,6 +57,19 @@ class TestDesignPriorities:
         normalized = priorities.normalized()
         
         assert normalized["robustness"] == 0.25
+    
+    def test_normalized_is_cached_until_weights_change(self):
+        """Test that cached weights survive caller edits and refresh on change."""
+        priorities = DesignPriorities(robustness=2.0)
+        
+        first = priorities.normalized()
+        first["robustness"] = 0.0
+        assert priorities.normalized()["robustness"] == pytest.approx(2.0 / 5.0)
+        
+        priorities.robustness = 5.0
+        refreshed = priorities.normalized()
+        
+        assert refreshed["robustness"] == pytest.approx(5.0 / 8.0)
 
 
 class TestAircraftInputs:
@@ -95,6 +113,21 @@ class TestAircraftInputs:
         
         assert inputs.get_mlw_kg() == 900.0
     
+    def test_mlw_fallback_after_copy_without_mlw(self):
+        """Test that a copy with mlw_kg cleared still falls back to 95% MTOW."""
+        inputs = AircraftInputs(
+            aircraft_name="Test",
+            mtow_kg=1000.0,
+            mlw_kg=900.0,
+            cg_fwd_m=2.0,
+            cg_aft_m=2.4,
+            landing_speed_mps=28.0,
+        )
+        
+        copied = inputs.model_copy(update={"mlw_kg": None})
+        
+        assert copied.get_mlw_kg() == pytest.approx(950.0)
+    
     def test_fuselage_length_estimation(self):
         """Test fuselage length estimation when not provided."""
         inputs = AircraftInputs(
@@ -108,6 +141,38 @@ class TestAircraftInputs:
         length = inputs.get_fuselage_length_m()
         assert 5 <= length <= 25
     
+    def test_inputs_are_frozen(self):
+        """Test that inputs cannot be changed in place."""
+        inputs = AircraftInputs(
+            aircraft_name="Test",
+            mtow_kg=1200.0,
+            cg_fwd_m=2.0,
+            cg_aft_m=2.4,
+            landing_speed_mps=28.0,
+        )
+        length = inputs.get_fuselage_length_m()
+        
+        with pytest.raises(ValidationError):
+            inputs.mtow_kg = 5000.0
+        assert inputs.get_fuselage_length_m() == length
+    
+    def test_estimates_follow_model_copy_update(self):
+        """Test that a copied model with new MTOW gets fresh estimates."""
+        kwargs = dict(
+            aircraft_name="Test",
+            cg_fwd_m=2.0,
+            cg_aft_m=2.4,
+            landing_speed_mps=28.0,
+        )
+        inputs = AircraftInputs(mtow_kg=1200.0, **kwargs)
+        inputs.get_fuselage_length_m()
+        inputs.get_cg_height_m()
+        
+        copied = inputs.model_copy(update={"mtow_kg": 8000.0})
+        fresh = AircraftInputs(mtow_kg=8000.0, **kwargs)
+        assert copied.get_fuselage_length_m() == fresh.get_fuselage_length_m()
+        assert copied.get_cg_height_m() == fresh.get_cg_height_m()
+    
     def test_explicit_fuselage_length_used(self):
         """Test that explicit fuselage length is used when provided."""
         inputs = AircraftInputs(
@@ -181,6 +246,61 @@ class TestGeometryRange:
         """Test span calculation."""
         range_ = GeometryRange(min=2.0, max=3.0)
         assert range_.span == 1.0
+    
+    def test_mid_and_span_follow_updates(self):
+        """Test that derived values track copies and assignments."""
+        range_ = GeometryRange(min=0.0, max=2.0)
+        assert range_.mid == 1.0 and range_.span == 2.0
+        
+        copied = range_.model_copy(update={"max": 4.0})
+        assert copied.mid == 2.0 and copied.span == 4.0
+        
+        range_.max = 6.0
+        assert range_.mid == 3.0 and range_.span == 6.0
+
+
+class TestChecksMask:
+    """Tests for the Checks pass/fail bitmask."""
+    
+    def _check(self, passed: bool) -> CheckResult:
+        return CheckResult(passed=passed, value=0.1, limit=0.0)
+    
+    def test_all_passed(self):
+        """Test that passing checks set every bit."""
+        checks = Checks(
+            tip_back_margin=self._check(True),
+            nose_over_margin=self._check(True),
+            ground_clearance_ok=True,
+        )
+        assert checks.passed_mask == ALL_CHECKS_PASSED_MASK
+        assert failed_check_names(checks.passed_mask) == ()
+    
+    def test_failed_names_in_check_order(self):
+        """Test that failures decode to names in the sweep's reporting order."""
+        checks = Checks(
+            tip_back_margin=self._check(True),
+            nose_over_margin=self._check(False),
+            ground_clearance_ok=True,
+            prop_clearance_ok=False,
+        )
+        assert failed_check_names(checks.passed_mask) == ("nose_over", "prop_clearance")
+    
+    def test_flags_mirror_checks(self):
+        """Test that the slim CheckFlags mirror reports the same mask."""
+        checks = Checks(
+            tip_back_margin=self._check(False),
+            nose_over_margin=self._check(True),
+            ground_clearance_ok=False,
+            lateral_stability_ok=False,
+        )
+        flags = CheckFlags(
+            checks.tip_back_margin,
+            checks.nose_over_margin,
+            checks.ground_clearance_ok,
+            checks.lateral_stability_ok,
+            checks.prop_clearance_ok,
+        )
+        assert flags.passed_mask == checks.passed_mask
 
 
 class TestJSONSerialization:
@@ -5,6 +5,7 @@ Tests energy, loads, geometry, and tire catalog calculations.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from gearrec.physics.energy import (
     calculate_touchdown_energy,
@@ -30,6 +31,10 @@ from gearrec.physics.geometry import (
     check_nose_over_margin,
     check_ground_clearance,
     check_lateral_rollover,
+    tip_back_margin,
+    nose_over_margin,
+    ground_clearance_margin,
+    estimate_tire_diameter,
 )
 from gearrec.physics.tire_catalog import (
     find_matching_tires,
@@ -95,6 +100,12 @@ class TestEnergyCalculations:
         assert light_max < heavy_max
         assert light_min < heavy_min
     
+    def test_recommended_stroke_band_boundaries(self):
+        """Test that each MTOW band starts at its lower bound (inclusive)."""
+        assert recommend_stroke_range_for_aircraft(1499.0, 2.0) == pytest.approx((0.10, 0.20))
+        assert recommend_stroke_range_for_aircraft(1500.0, 2.0) == pytest.approx((0.15, 0.25))
+        assert recommend_stroke_range_for_aircraft(6000.0, 2.0) == pytest.approx((0.25, 0.40))
+    
     def test_load_factor_calculation(self):
         """Test landing load factor is reasonable for typical GA."""
         n = calculate_load_factor_from_sink(2.0, 0.2, efficiency=0.8)
@@ -199,6 +210,15 @@ class TestGeometryCalculations:
         
         assert heavy_min >= light_min
     
+    def test_strut_and_tire_band_boundaries(self):
+        """Test that each weight/load band starts at its lower bound (inclusive)."""
+        assert calculate_strut_length_range(999.0) == pytest.approx((0.30, 0.45))
+        assert calculate_strut_length_range(1000.0) == pytest.approx((0.35, 0.55))
+        assert calculate_strut_length_range(4000.0) == pytest.approx((0.60, 0.90))
+        assert estimate_tire_diameter(2999.0) == pytest.approx((0.25, 0.35))
+        assert estimate_tire_diameter(3000.0) == pytest.approx((0.30, 0.40))
+        assert estimate_tire_diameter(20000.0) == pytest.approx((0.55, 0.75))
+    
     def test_cg_height_estimate(self):
         """Test CG height estimation."""
         height_light = estimate_cg_height(1000)
@@ -223,6 +243,28 @@ class TestGeometryCalculations:
         )
         assert not result.passed
     
+    def test_ground_clearance_core_matches_check(self):
+        """Test that the clearance core agrees with check_ground_clearance."""
+        for required in (0.0, 0.25, 0.6):
+            passed, margin = ground_clearance_margin(0.45, 0.15, 0.18, required)
+            expected = check_ground_clearance(0.45, 0.15, 0.18, required)
+            
+            assert passed == expected.passed
+            assert margin == pytest.approx(expected.margin_value)
+    
+    def test_stability_cores_match_checks(self):
+        """Test that the tip-back/nose-over cores agree with the full checks."""
+        for cg in (2.1, 2.4, 2.6):
+            passed, margin = tip_back_margin(cg, 2.55, 1.8)
+            expected = check_tip_back_margin(cg, 2.55, 1.8, 1.1)
+            assert passed == expected.passed
+            assert margin == expected.margin_value
+            
+            passed, margin = nose_over_margin(cg, 0.75, 1.1, 0.4)
+            expected = check_nose_over_margin(cg, 2.55, 0.75, 1.1, 0.4)
+            assert passed == expected.passed
+            assert margin == expected.margin_value
+    
     def test_lateral_rollover_check(self):
         """Test lateral rollover stability check."""
         result_stable = check_lateral_rollover(track_m=2.5, cg_height_m=1.2)
@@ -268,6 +310,17 @@ class TestTireCatalog:
             # Soft field first choice should be at least as wide
             assert soft_tires[0].width_m >= normal_tires[0].width_m * 0.9
     
+    def test_find_matching_tires_shares_frozen_tires(self):
+        """Test that matches reuse the prebuilt, immutable catalog tires."""
+        first = find_matching_tires(required_load_N=8000)
+        second = find_matching_tires(required_load_N=8000)
+        
+        assert first and all(a is b for a, b in zip(first, second))
+        # Memoized matches still hand each caller its own list
+        assert first is not second
+        with pytest.raises(ValidationError):
+            first[0].max_load_N = 0.0
+    
     def test_estimate_tire_dimensions_grass_wider(self):
         """Test that grass runway shifts tire width recommendations upward."""
         paved_diam, paved_width = estimate_tire_dimensions(5000, "paved")
@@ -303,3 +356,20 @@ class TestUnitConversions:
         original = 123.45
         converted = N_to_kg(kg_to_N(original))
         assert converted == pytest.approx(original, rel=0.0001)
+    
+    def test_lazy_registry_names(self):
+        """Test that the lazily built pint names match the float constants."""
+        from gearrec.physics import G_STANDARD, Q_
+        from gearrec.physics.units import G_MPS2, ureg
+        
+        assert G_STANDARD.magnitude == G_MPS2
+        assert G_STANDARD.units == ureg.meter / ureg.second ** 2
+        assert Q_(1.0, "kg").to("g").magnitude == pytest.approx(1000.0)
+    
+    def test_magnitude_in(self):
+        """Test magnitude_in for multiplicative and offset units."""
+        from gearrec.physics import Q_
+        from gearrec.physics.units import magnitude_in
+        
+        assert magnitude_in(Q_(12.5, "kN"), "N") == pytest.approx(12500.0)
+        assert magnitude_in(Q_(20.0, "degC"), "K") == pytest.approx(293.15)
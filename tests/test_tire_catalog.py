@@ -12,6 +12,7 @@ Tests cover:
 
 import json
 import pytest
+from pydantic import ValidationError
 
 from gearrec.tire_catalog.models import TireSpec, ApplicationRow, MatchedTire
 from gearrec.tire_catalog.matcher import (
@@ -22,6 +23,7 @@ from gearrec.tire_catalog.matcher import (
     choose_tires_for_concept,
     SAFETY_FACTORS,
 )
+from gearrec.tire_catalog.loader import load_tire_specs
 from gearrec.tire_catalog.import_goodyear_2022 import (
     parse_tire_data_line,
     parse_application_line,
@@ -336,7 +338,17 @@ class TestPDFParsing:
         assert "172" in app.model
         assert app.main_tire_size == "6.00-6"
         assert app.aux_tire_size == "5.00-5"
-    
+
+    def test_parse_application_line_prefers_longest_manufacturer(self):
+        """Test that BEECHCRAFT is not split into BEECH + 'craft'."""
+        line = "Beechcraft Bonanza 7.00-6 6 TL 5.00-5 6 TL"
+
+        app = parse_application_line(line, page=3)
+
+        assert app is not None
+        assert app.manufacturer == "BEECHCRAFT"
+        assert app.model == "Bonanza"
+
     def test_parse_application_line_skips_headers(self):
         """Test that header lines are skipped."""
         headers = [
@@ -476,6 +488,24 @@ class TestJSONSerialization:
         assert data["size"] == "6.00-6"
         assert data["rated_load_lbs"] == 1600
         assert "reasons" in data
+    
+    def test_load_tire_specs_caches_until_file_changes(self, tmp_path):
+        """Test that repeated loads share parsed rows until the file is rewritten."""
+        path = tmp_path / "tires.json"
+        path.write_text(json.dumps([{"size": "6.00-6", "rated_load_lbs": 1600}]))
+        
+        first = load_tire_specs(str(path))
+        second = load_tire_specs(str(path))
+        assert first == second and first is not second
+        assert first[0] is second[0]
+        with pytest.raises(ValidationError):
+            first[0].rated_load_lbs = 0
+        
+        path.write_text(json.dumps([
+            {"size": "6.00-6", "rated_load_lbs": 1600},
+            {"size": "5.00-5", "rated_load_lbs": 900},
+        ]))
+        assert [s.size for s in load_tire_specs(str(path))] == ["6.00-6", "5.00-5"]
 
 
 # =============================================================================